@@ -1,13 +1,84 @@
 """Streamlit frontend for CSV data quality checker."""
 
 import streamlit as st
-import pandas as pd
-import tempfile
-import os
-from pathlib import Path
+import pyarrow as pa
+import io
+from functools import lru_cache
+import hashlib
 import json
 
-from src.quality_pipeline import run_quality_checks, format_results_summary, get_detailed_issues
+try:
+    import orjson
+except ImportError:  # Optional speedup; stdlib json is used when orjson is not installed
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:  # Optional speedup; hashlib.blake2b is used when xxhash is not installed
+    xxhash = None
+
+# src.quality_pipeline (and with it pandas) is imported inside the functions that run
+# checks, so the first render with no data does not pay for loading it
+
+# Sidebar text area defaults, seeded into session state once per session
+_DEFAULT_SCHEMA_JSON = '{\n  "participant_id": "str",\n  "visit_date": "datetime",\n  "age": "int",\n  "gender": "str",\n  "blood_pressure": "str",\n  "diagnosis": "str"\n}'
+_DEFAULT_RULES_JSON = '{\n  "age": {"min": 0, "max": 120},\n  "gender": {"allowed": ["M", "F", "Other"]},\n  "diagnosis": {"allowed": ["Healthy", "Hypertension", "Diabetes", "Asthma"]}\n}'
+
+
+@lru_cache(maxsize=8)
+def _parse_json(text: str):
+    """Parse sidebar JSON, memoized since the text areas rarely change between reruns."""
+    return json.loads(text)
+
+
+def _digest_bytes(data: bytes) -> str:
+    """Fingerprint CSV bytes for the results cache key (XXH3 when available)."""
+    if xxhash is not None:
+        return xxhash.xxh3_128_hexdigest(data)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _cached_checks(csv_digest: str, _csv_bytes: bytes, schema_key: str, rules_key: str, min_rows: int) -> dict:
+    """
+    Run the quality pipeline on raw CSV bytes, memoized across Streamlit reruns.
+    
+    The cache is keyed on csv_digest; the leading underscore keeps Streamlit from
+    re-hashing the raw bytes itself. Schema and rules are passed as sorted JSON
+    strings so they hash stably. Entries are capped so a long-lived server that
+    sees many distinct uploads does not keep every result set in memory.
+    """
+    from src.quality_pipeline import run_quality_checks
+    
+    return run_quality_checks(
+        io.BytesIO(_csv_bytes),
+        schema=json.loads(schema_key),
+        rules=json.loads(rules_key),
+        min_rows=min_rows
+    )
+
+
+def _serialize_results(results: dict) -> tuple:
+    """
+    Build the JSON used by the raw view and download together with the text summary.
+    
+    main() calls this once per check run and keeps the output in session state next
+    to the results. It is deliberately not st.cache_data: hashing a large results
+    dict for the cache key costs more than serializing it.
+    """
+    from src.quality_pipeline import format_results_summary
+    
+    summary_text = format_results_summary(results)
+    if orjson is not None:
+        # OPT_SERIALIZE_NUMPY covers the numpy scalars pandas leaves in outlier values
+        results_json = orjson.dumps(
+            results,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            default=str
+        ).decode()
+    else:
+        results_json = json.dumps(results, indent=2, default=str)
+    return results_json, summary_text
 
 
 def main():
@@ -42,9 +113,10 @@ def main():
         schema_json = ""
         if schema_enabled:
             st.warning("⚠️ Manual schema will override automatic detection. Only use if you need specific type constraints.")
+            st.session_state.setdefault('schema_json', _DEFAULT_SCHEMA_JSON)
             schema_json = st.text_area(
                 "Manual Schema (JSON format)",
-                value='{\n  "participant_id": "str",\n  "visit_date": "datetime",\n  "age": "int",\n  "gender": "str",\n  "blood_pressure": "str",\n  "diagnosis": "str"\n}',
+                key='schema_json',
                 height=150,
                 help="Define expected data types for columns. Supported types: int, float, str, bool, datetime"
             )
@@ -54,9 +126,10 @@ def main():
         rules_enabled = st.checkbox("Enable value range/set validation")
         rules_json = ""
         if rules_enabled:
+            st.session_state.setdefault('rules_json', _DEFAULT_RULES_JSON)
             rules_json = st.text_area(
                 "Rules (JSON format)",
-                value='{\n  "age": {"min": 0, "max": 120},\n  "gender": {"allowed": ["M", "F", "Other"]},\n  "diagnosis": {"allowed": ["Healthy", "Hypertension", "Diabetes", "Asthma"]}\n}',
+                key='rules_json',
                 height=150,
                 help="Define validation rules for columns. Use 'min'/'max' for numeric ranges, 'allowed' for categorical values"
             )
@@ -72,6 +145,7 @@ def main():
     )
     
     csv_data = None
+    uploaded_file = None
     filename = None
     
     if input_method == "Upload CSV File":
@@ -82,7 +156,6 @@ def main():
         )
         
         if uploaded_file is not None:
-            csv_data = uploaded_file.getvalue().decode('utf-8')
             filename = uploaded_file.name
     
     else:  # Paste CSV Data
@@ -133,45 +206,53 @@ P010,2025-01-15,invalid_age,M,140/89,Diabetes"""
             csv_data = csv_text
             filename = "pasted_data.csv"
     
-    if csv_data is not None:
-        # Save CSV data to temporary file (works for both upload and paste)
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix=".csv", encoding='utf-8') as tmp_file:
-            tmp_file.write(csv_data)
-            tmp_file_path = tmp_file.name
+    if uploaded_file is not None or csv_data is not None:
+        # Parse configurations
+        schema = None
+        if schema_enabled and schema_json.strip():
+            try:
+                schema = _parse_json(schema_json)
+            except json.JSONDecodeError as e:
+                st.error(f"Invalid schema JSON: {e}")
+                return
         
-        try:
-            # Parse configurations
-            schema = None
-            if schema_enabled and schema_json.strip():
-                try:
-                    schema = json.loads(schema_json)
-                except json.JSONDecodeError as e:
-                    st.error(f"Invalid schema JSON: {e}")
-                    return
-            
-            rules = None
-            if rules_enabled and rules_json.strip():
-                try:
-                    rules = json.loads(rules_json)
-                except json.JSONDecodeError as e:
-                    st.error(f"Invalid rules JSON: {e}")
-                    return
-            
-            # Run quality checks
-            with st.spinner("Running quality checks..."):
-                results = run_quality_checks(
-                    tmp_file_path,
-                    schema=schema,
-                    rules=rules,
-                    min_rows=min_rows
+        rules = None
+        if rules_enabled and rules_json.strip():
+            try:
+                rules = _parse_json(rules_json)
+            except json.JSONDecodeError as e:
+                st.error(f"Invalid rules JSON: {e}")
+                return
+        
+        # Works for both upload and paste; getvalue() exposes the upload buffer directly
+        csv_bytes = uploaded_file.getvalue() if uploaded_file is not None else csv_data.encode('utf-8')
+        schema_key = json.dumps(schema, sort_keys=True)
+        rules_key = json.dumps(rules, sort_keys=True)
+        csv_digest = _digest_bytes(csv_bytes)
+        run_key = (csv_digest, schema_key, rules_key, min_rows)
+        
+        # Checks only run on request (e.g. not on the rerun triggered by 'Load Example');
+        # the last results are kept in session state and shown while the input is unchanged
+        if st.button("▶️ Run Quality Checks", type="primary"):
+            # Run quality checks (cached on the CSV bytes and configuration); the status
+            # box shows progress while the script thread runs them
+            with st.status("Running quality checks...") as status:
+                results = _cached_checks(
+                    csv_digest,
+                    csv_bytes,
+                    schema_key,
+                    rules_key,
+                    min_rows
                 )
-            
+                st.session_state.last_results = (run_key, results, _serialize_results(results))
+                status.update(label="Quality checks complete", state="complete")
+        
+        last_key, last_results, last_serialized = st.session_state.get('last_results', (None, None, None))
+        if last_key == run_key:
             # Display results
-            display_results(results, filename)
-            
-        finally:
-            # Clean up temporary file
-            os.unlink(tmp_file_path)
+            display_results(last_results, filename, last_serialized)
+        else:
+            st.info("👆 Click 'Run Quality Checks' to analyze this data")
     
     else:
         # Show example/instructions when no data is provided
@@ -183,7 +264,7 @@ P010,2025-01-15,invalid_age,M,140/89,Diabetes"""
             1. **Provide CSV Data**: Either upload a file or paste CSV data
                - **Upload**: Select a .csv file from your computer
                - **Paste**: Copy and paste CSV data directly, or click 'Load Example'
-            2. **Automatic Analysis**: The tool automatically detects data types and finds outliers
+            2. **Run Quality Checks**: Click the button; the tool automatically detects data types and finds outliers
             3. **Optional Configuration**: Use the sidebar for additional validation rules:
                - **Minimum rows**: Set the minimum number of rows required  
                - **Manual schema**: Override automatic detection (advanced users)
@@ -211,47 +292,54 @@ P010,2025-01-15,invalid_age,M,140/89,Diabetes"""
             """)
 
 
-def display_results(results: dict, filename: str):
+def display_results(results: dict, filename: str, serialized: tuple = None):
     """Display quality check results in the Streamlit interface."""
     
     # Summary section
     st.header("📊 Summary Dashboard")
     
     if not results['load_success']:
-        st.error("❌ Failed to load the CSV file")
-        for error in results.get('errors', []):
-            st.error(f"Error: {error}")
+        # One error element for the whole failure instead of one per message
+        errors = results.get('errors', [])
+        message = "❌ Failed to load the CSV file"
+        if errors:
+            message += "\n\n" + "\n".join(f"- Error: {error}" for error in errors)
+        st.error(message)
         return
     
     # Key metrics
     data_info = results.get('data_info', {})
     summary = results.get('summary', {})
+    row_count = data_info.get('row_count', 0)
+    column_count = data_info.get('column_count', 0)
+    passed_checks = summary.get('passed_checks', 0)
+    total_checks = summary.get('total_checks', 0)
+    success_rate = summary.get('success_rate', 0)
     
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         st.metric(
             "Rows", 
-            data_info.get('row_count', 0),
+            row_count,
             help="Total number of rows in the dataset"
         )
     
     with col2:
         st.metric(
             "Columns", 
-            data_info.get('column_count', 0),
+            column_count,
             help="Total number of columns in the dataset"
         )
     
     with col3:
         st.metric(
             "Checks Passed", 
-            f"{summary.get('passed_checks', 0)}/{summary.get('total_checks', 0)}",
+            f"{passed_checks}/{total_checks}",
             help="Number of quality checks that passed"
         )
     
     with col4:
-        success_rate = summary.get('success_rate', 0)
         st.metric(
             "Success Rate", 
             f"{success_rate}%",
@@ -266,161 +354,266 @@ def display_results(results: dict, filename: str):
         st.warning("⚠️ Some quality checks failed. See details below.")
     
     # Detailed results
-    display_detailed_results(results)
+    display_detailed_results(results, filename, serialized)
+
+
+def _rows_to_arrow(rows: list, columns: list, dictionary_columns: tuple = ()) -> pa.Table:
+    """
+    Build an Arrow table from result rows for st.dataframe, skipping the pandas round-trip.
+    
+    The 'value' column holds whatever the CSV cell contained (ints, strings, dates),
+    so it is rendered as text to give Arrow a single column type.
+    """
+    arrays = {}
+    for column in columns:
+        if column == 'value':
+            array = pa.array([str(row.get(column)) for row in rows], type=pa.string())
+        else:
+            array = pa.array([row.get(column) for row in rows])
+        arrays[column] = array.dictionary_encode() if column in dictionary_columns else array
+    return pa.table(arrays)
+
+
+def _display_passed_checks(checks: list):
+    """Display a condensed summary when every check passed."""
+    st.success("✅ Every check passed - no issues to review.")
+    
+    summary_rows = [
+        {'Check': check.get('check_type', 'unknown').replace('_', ' ').title(), 'Message': check.get('message', 'No message')}
+        for check in checks
+    ]
+    st.table(_rows_to_arrow(summary_rows, ['Check', 'Message']))
+    
+    # Inferred types are still useful on clean data; show them as one table
+    for check in checks:
+        if check.get('check_type') == 'automatic_quality':
+            type_rows = [
+                {
+                    'Column': column,
+                    'Inferred Type': analysis.get('inferred_type', 'unknown'),
+                    'Confidence (%)': round(analysis.get('confidence', 0) * 100, 1)
+                }
+                for column, analysis in check.get('column_analysis', {}).items()
+            ]
+            st.write("**Inferred Column Types:**")
+            st.dataframe(
+                _rows_to_arrow(type_rows, ['Column', 'Inferred Type', 'Confidence (%)'], dictionary_columns=('Inferred Type',)),
+                use_container_width=True
+            )
+
+
+def _render_row_count(check: dict):
+    """Show actual vs required row counts."""
+    col1, col2 = st.columns(2)
+    with col1:
+        st.metric("Actual Rows", check.get('row_count', 0))
+    with col2:
+        st.metric("Required Minimum", check.get('min_rows_required', 1))
+
+
+def _render_data_types(check: dict):
+    """Show type mismatches, missing columns and invalid cell contents."""
+    mismatches = check.get('mismatches', {})
+    missing = check.get('missing_columns', [])
+    
+    if mismatches:
+        st.subheader("Type Mismatches")
+        mismatch_data = []
+        for col, details in mismatches.items():
+            mismatch_data.append({
+                'Column': col,
+                'Expected Type': details['expected'],
+                'Actual Type': details['actual'],
+                'Sample Values': str(details['sample_values'][:3])
+            })
+        mismatch_table = _rows_to_arrow(
+            mismatch_data,
+            ['Column', 'Expected Type', 'Actual Type', 'Sample Values'],
+            dictionary_columns=('Expected Type', 'Actual Type')
+        )
+        st.dataframe(mismatch_table, use_container_width=True)
+    
+    if missing:
+        st.subheader("Missing Columns")
+        st.write(", ".join(missing))
+    
+    # Display content issues (new feature)
+    content_issues = check.get('content_issues', {})
+    if content_issues:
+        st.subheader("Content Issues")
+        for col, issue_info in content_issues.items():
+            st.write(f"**{col}** ({issue_info['total_invalid']} invalid values):")
+            if issue_info.get('invalid_values'):
+                issue_table = _rows_to_arrow(
+                    issue_info['invalid_values'],
+                    ['row_index', 'value', 'issue']
+                )
+                st.dataframe(issue_table, use_container_width=True)
+
+
+def _render_value_ranges(check: dict):
+    """Show range/allowed-value violations per column."""
+    violations = check.get('violations', {})
+    
+    if violations:
+        st.subheader(f"Violations ({check.get('total_violations', 0)} total)")
+    
+        for column, violation_info in violations.items():
+            if 'error' in violation_info:
+                st.error(f"**{column}**: {violation_info['error']}")
+                continue
+    
+            st.write(f"**{column}**: {violation_info['violation_count']} violations")
+    
+            if violation_info.get('violating_rows'):
+                violation_table = _rows_to_arrow(
+                    violation_info['violating_rows'],
+                    ['row_index', 'value', 'rule_violated'],
+                    dictionary_columns=('rule_violated',)
+                )
+                st.dataframe(violation_table, use_container_width=True)
+
+
+def _render_data_consistency(check: dict):
+    """Show missing-value, mixed-type and constant-value issues per column."""
+    issues = check.get('issues', {})
+    
+    if issues:
+        st.subheader(f"Consistency Issues ({check.get('total_issues', 0)} total)")
+    
+        for column, column_issues in issues.items():
+            st.write(f"**{column}**:")
+            for issue in column_issues:
+                issue_type = issue.get('type', 'unknown')
+    
+                if issue_type == 'missing_values':
+                    st.write(f"  • Missing values: {issue['count']} ({issue['percentage']}%)")
+                elif issue_type == 'mixed_types':
+                    st.write(f"  • Mixed data types: {issue['numeric_values']} numeric, {issue['text_values']} text values")
+                elif issue_type == 'constant_values':
+                    st.write(f"  • All values are identical: {issue['message']}")
+                else:
+                    st.write(f"  • {issue}")
+
+
+def _render_automatic_quality(check: dict):
+    """Show automatically detected outliers, or the inferred types when there are none."""
+    column_analysis = check.get('column_analysis', {})
+    
+    if check.get('total_outliers', 0) > 0:
+        st.subheader(f"🎯 Automatic Outlier Detection ({check.get('total_outliers', 0)} outliers found)")
+    
+        # One table keyed by column instead of a heading + table per column
+        outlier_rows = [
+            {
+                'column': column,
+                'inferred_type': analysis.get('inferred_type', 'unknown'),
+                'confidence': round(analysis.get('confidence', 0) * 100, 1),
+                **outlier
+            }
+            for column, analysis in column_analysis.items()
+            for outlier in analysis.get('outliers', [])
+        ]
+        outlier_table = _rows_to_arrow(
+            outlier_rows,
+            ['column', 'inferred_type', 'confidence', 'row_index', 'value', 'issue'],
+            dictionary_columns=('column', 'inferred_type')
+        )
+        st.dataframe(outlier_table, use_container_width=True)
+        if len(outlier_rows) < check.get('total_outliers', 0):
+            st.caption(f"Showing the first {len(outlier_rows)} of {check['total_outliers']} outliers; every outlier is counted.")
+    else:
+        st.subheader("🎯 Automatic Outlier Detection")
+        st.success("No outliers detected! All data appears consistent with inferred types.")
+    
+        # Show inferred types for each column
+        st.write("**Inferred Column Types:**")
+        for column, analysis in column_analysis.items():
+            inferred_type = analysis.get('inferred_type', 'unknown')
+            confidence = analysis.get('confidence', 0) * 100
+            patterns = analysis.get('type_percentages', {})
+    
+            # Create a simple breakdown
+            pattern_str = ", ".join(f"{k}: {v:.0f}%" for k, v in patterns.items() if v > 0)
+            st.write(f"  • **{column}**: {inferred_type} ({confidence:.1f}% confidence) - {pattern_str}")
+
 
+# Per-check detail renderers, looked up once per check instead of an if/elif chain
+_CHECK_RENDERERS = {
+    'row_count': _render_row_count,
+    'data_types': _render_data_types,
+    'value_ranges': _render_value_ranges,
+    'data_consistency': _render_data_consistency,
+    'automatic_quality': _render_automatic_quality,
+}
 
-def display_detailed_results(results: dict):
-    """Display detailed quality check results."""
+
+def display_detailed_results(results: dict, filename: str = None, serialized: tuple = None):
+    """
+    Display detailed quality check results.
+    
+    Download file names are derived from filename when given, since results are
+    cached by content and their file_path does not reflect what the user uploaded.
+    serialized is the (JSON, summary) pair from _serialize_results when the caller
+    already has it; otherwise it is built here.
+    """
+    from pathlib import Path
     
     st.header("🔍 Detailed Results")
     
-    # Check results
-    for i, check in enumerate(results.get('checks', [])):
-        check_type = check.get('check_type', 'unknown').replace('_', ' ').title()
-        passed = check.get('passed', False)
-        
-        with st.expander(
-            f"{'✅' if passed else '❌'} {check_type} Check", 
-            expanded=not passed
-        ):
-            st.write(f"**Status**: {'Passed' if passed else 'Failed'}")
-            st.write(f"**Message**: {check.get('message', 'No message')}")
-            
-            # Display specific details based on check type
-            if check.get('check_type') == 'row_count':
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.metric("Actual Rows", check.get('row_count', 0))
-                with col2:
-                    st.metric("Required Minimum", check.get('min_rows_required', 1))
-            
-            elif check.get('check_type') == 'data_types':
-                mismatches = check.get('mismatches', {})
-                missing = check.get('missing_columns', [])
-                
-                if mismatches:
-                    st.subheader("Type Mismatches")
-                    mismatch_data = []
-                    for col, details in mismatches.items():
-                        mismatch_data.append({
-                            'Column': col,
-                            'Expected Type': details['expected'],
-                            'Actual Type': details['actual'],
-                            'Sample Values': str(details['sample_values'][:3])
-                        })
-                    st.dataframe(pd.DataFrame(mismatch_data), use_container_width=True)
-                
-                if missing:
-                    st.subheader("Missing Columns")
-                    st.write(", ".join(missing))
-                
-                # Display content issues (new feature)
-                content_issues = check.get('content_issues', {})
-                if content_issues:
-                    st.subheader("Content Issues")
-                    for col, issue_info in content_issues.items():
-                        st.write(f"**{col}** ({issue_info['total_invalid']} invalid values):")
-                        if issue_info.get('invalid_values'):
-                            issue_df = pd.DataFrame(issue_info['invalid_values'])
-                            st.dataframe(issue_df, use_container_width=True)
-            
-            elif check.get('check_type') == 'value_ranges':
-                violations = check.get('violations', {})
-                
-                if violations:
-                    st.subheader(f"Violations ({check.get('total_violations', 0)} total)")
-                    
-                    for column, violation_info in violations.items():
-                        if 'error' in violation_info:
-                            st.error(f"**{column}**: {violation_info['error']}")
-                            continue
-                        
-                        st.write(f"**{column}**: {violation_info['violation_count']} violations")
-                        
-                        if violation_info.get('violating_rows'):
-                            violation_df = pd.DataFrame(violation_info['violating_rows'])
-                            st.dataframe(violation_df, use_container_width=True)
-            
-            elif check.get('check_type') == 'data_consistency':
-                issues = check.get('issues', {})
-                
-                if issues:
-                    st.subheader(f"Consistency Issues ({check.get('total_issues', 0)} total)")
-                    
-                    for column, column_issues in issues.items():
-                        st.write(f"**{column}**:")
-                        for issue in column_issues:
-                            issue_type = issue.get('type', 'unknown')
-                            
-                            if issue_type == 'missing_values':
-                                st.write(f"  • Missing values: {issue['count']} ({issue['percentage']}%)")
-                            elif issue_type == 'mixed_types':
-                                st.write(f"  • Mixed data types: {issue['numeric_values']} numeric, {issue['text_values']} text values")
-                            elif issue_type == 'constant_values':
-                                st.write(f"  • All values are identical: {issue['message']}")
-                            else:
-                                st.write(f"  • {issue}")
+    checks = results.get('checks', [])
+    
+    if checks and all(check.get('passed', False) for check in checks):
+        # Fast path: nothing to investigate, so skip the per-check expanders and widgets
+        _display_passed_checks(checks)
+    else:
+        # Check results
+        for check in checks:
+            check_type = check.get('check_type', 'unknown')
+            check_label = check_type.replace('_', ' ').title()
+            passed = check.get('passed', False)
             
-            elif check.get('check_type') == 'automatic_quality':
-                column_analysis = check.get('column_analysis', {})
+            with st.expander(
+                f"{'✅' if passed else '❌'} {check_label} Check", 
+                expanded=not passed
+            ):
+                st.write(f"**Status**: {'Passed' if passed else 'Failed'}")
+                st.write(f"**Message**: {check.get('message', 'No message')}")
                 
-                if check.get('total_outliers', 0) > 0:
-                    st.subheader(f"🎯 Automatic Outlier Detection ({check.get('total_outliers', 0)} outliers found)")
-                    
-                    for column, analysis in column_analysis.items():
-                        outliers = analysis.get('outliers', [])
-                        if outliers:
-                            inferred_type = analysis.get('inferred_type', 'unknown')
-                            confidence = analysis.get('confidence', 0) * 100
-                            
-                            st.write(f"**{column}** (inferred type: {inferred_type}, confidence: {confidence:.1f}%)")
-                            
-                            # Show outliers in a table
-                            outlier_df = pd.DataFrame(outliers)
-                            if not outlier_df.empty:
-                                st.dataframe(outlier_df[['row_index', 'value', 'issue']], use_container_width=True)
-                else:
-                    st.subheader("🎯 Automatic Outlier Detection")
-                    st.success("No outliers detected! All data appears consistent with inferred types.")
-                    
-                    # Show inferred types for each column
-                    st.write("**Inferred Column Types:**")
-                    for column, analysis in column_analysis.items():
-                        inferred_type = analysis.get('inferred_type', 'unknown')
-                        confidence = analysis.get('confidence', 0) * 100
-                        patterns = analysis.get('type_percentages', {})
-                        
-                        # Create a simple breakdown
-                        pattern_str = ", ".join([f"{k}: {v:.0f}%" for k, v in patterns.items() if v > 0])
-                        st.write(f"  • **{column}**: {inferred_type} ({confidence:.1f}% confidence) - {pattern_str}")
-    
-    # Raw results (for debugging)
-    with st.expander("🔧 Raw Results (JSON)", expanded=False):
-        st.json(results)
+                # Display specific details based on check type
+                renderer = _CHECK_RENDERERS.get(check_type)
+                if renderer is not None:
+                    renderer(check)
+        
+    results_json, summary_text = serialized or _serialize_results(results)
+    
+    # Raw results (for debugging) - only serialized for the frontend when requested
+    if st.button("🔧 Show Raw Results (JSON)"):
+        st.json(results_json)
     
     # Download options
     st.header("💾 Download Options")
     
+    download_stem = Path(filename or results.get('file_path') or 'data').stem
+    
     col1, col2 = st.columns(2)
     
     with col1:
         # Download results as JSON
-        results_json = json.dumps(results, indent=2, default=str)
         st.download_button(
             label="📄 Download Results (JSON)",
             data=results_json,
-            file_name=f"quality_results_{Path(results['file_path']).stem}.json",
+            file_name=f"quality_results_{download_stem}.json",
             mime="application/json",
             help="Download the complete quality check results as JSON"
         )
     
     with col2:
         # Download formatted summary
-        summary_text = format_results_summary(results)
         st.download_button(
             label="📋 Download Summary (TXT)",
             data=summary_text,
-            file_name=f"quality_summary_{Path(results['file_path']).stem}.txt",
+            file_name=f"quality_summary_{download_stem}.txt",
             mime="text/plain",
             help="Download a formatted summary of the quality check results"
         )
@@ -1,9 +1,110 @@
 """Data quality check functions."""
 
+import numpy as np
 import pandas as pd
-from typing import Dict, Any, List, Union, Optional
+from typing import Dict, Any, List, Tuple, Union, Optional, Iterable, Iterator
+import copy
+import hashlib
+import os
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # Regex prefilters fall back to the pandas string accessor
+    pa = None
+    pc = None
+
+# Strings matching these are always accepted by int()/float() after strip(); anything
+# else falls through to the exact per-value validators
+_FAST_ACCEPT_PATTERNS = {
+    'int': r'^\s*[+-]?[0-9]+\s*$',
+    'float': r'^\s*[+-]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?\s*$',
+    'datetime': r'^[0-9]{4}-[0-9]{2}-[0-9]{2}$'  # Calendar validity is checked separately
+}
+
+# pandas dtypes accepted for each schema type, including the nullable and
+# pyarrow-backed spellings (pyarrow names float64/float32 'double'/'float')
+_TYPE_MAPPING = {
+    'int': frozenset({
+        'int64', 'int32', 'int16', 'int8', 'Int64', 'Int32', 'Int16', 'Int8',
+        'int64[pyarrow]', 'int32[pyarrow]', 'int16[pyarrow]', 'int8[pyarrow]'
+    }),
+    'float': frozenset({'float64', 'float32', 'Float64', 'Float32', 'double[pyarrow]', 'float[pyarrow]'}),
+    'str': frozenset({'object', 'category', 'string', 'string[pyarrow]', 'large_string[pyarrow]'}),
+    'bool': frozenset({'bool', 'boolean', 'bool[pyarrow]'}),
+    'datetime': frozenset({
+        'datetime64[ns]', 'datetime64[us]', 'datetime64[ms]', 'datetime64[s]', 'datetime64',
+        'timestamp[ns][pyarrow]', 'timestamp[us][pyarrow]', 'timestamp[ms][pyarrow]', 'timestamp[s][pyarrow]'
+    })
+}
+
+_VALID_BOOLS = frozenset({'true', 'false', '1', '0', 'yes', 'no', 'y', 'n', 't', 'f'})
+
+# Common date shapes, each paired with the strptime format that parses it
+_DATE_FORMATS = (
+    (re.compile(r'^\d{4}-\d{2}-\d{2}$'), '%Y-%m-%d'),  # YYYY-MM-DD
+    (re.compile(r'^\d{2}/\d{2}/\d{4}$'), '%m/%d/%Y'),  # MM/DD/YYYY
+    (re.compile(r'^\d{2}-\d{2}-\d{4}$'), '%m-%d-%Y'),  # MM-DD-YYYY
+    (re.compile(r'^\d{4}/\d{2}/\d{2}$'), '%Y/%m/%d'),  # YYYY/MM/DD
+)
+
+# Buckets assigned by _classify_values, in precedence order
+_CLASSIFICATIONS = ('integer', 'float', 'date', 'structured_text', 'short_categorical', 'text')
+
+# Structured text shapes recognised by type inference
+_STRUCTURED_PATTERNS = {
+    'number/number': re.compile(r'^\d+/\d+$'),  # Like 120/80
+    'letter+digits': re.compile(r'^[A-Z][0-9]+$')  # Like P001
+}
+
+# Bits recording which types a stripped cell string parses as (see _value_flags)
+_INT, _FLOAT, _DATE, _BOOL = 1, 2, 4, 8
+_TYPE_FLAGS = {'int': _INT, 'float': _FLOAT, 'datetime': _DATE, 'bool': _BOOL}
+
+# Longer strings (free text, notes) are classified without being memoized, so the
+# verdict cache cannot pin arbitrarily large cell values for the life of the process.
+_VALUE_FLAGS_MAX_CACHED_LEN = 64
+
+# Column analyses from infer_column_types, keyed by a content fingerprint so re-running
+# checks on the same data (e.g. after editing rules in the app) skips inference.
+# Columns shorter than the minimum are cheaper to infer than to hash.
+_INFERENCE_CACHE_SIZE = 128
+_INFERENCE_CACHE_MIN_ROWS = 1000
+_inference_cache = OrderedDict()
+_inference_cache_lock = threading.Lock()
+
+# Frames wider than this spread their per-column work over a thread pool
+_PARALLEL_MIN_COLUMNS = 8
+
+
+def _map_columns(func, items: list) -> list:
+    """
+    Apply func to each per-column work item, returning results in order.
+    
+    Columns are checked independently, and most of the work happens in pandas/NumPy
+    kernels that release the GIL, so wide frames use a thread pool.
+    """
+    workers = min(32, os.cpu_count() or 1)
+    if len(items) <= _PARALLEL_MIN_COLUMNS or workers < 2:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, items))
+
+
+def _iter_chunks(data: Union[pd.DataFrame, Iterable[pd.DataFrame]], chunksize: int) -> Iterator[pd.DataFrame]:
+    """Yield row slices of a DataFrame, or pass through an iterable of chunks as-is."""
+    if isinstance(data, pd.DataFrame):
+        # An empty frame is still yielded once so its columns are seen
+        for start in range(0, max(len(data), 1), chunksize):
+            yield data.iloc[start:start + chunksize]
+    else:
+        yield from data
 
 
 def check_row_count(df: pd.DataFrame, min_rows: int = 1) -> Dict[str, Any]:
@@ -29,10 +130,26 @@ def check_row_count(df: pd.DataFrame, min_rows: int = 1) -> Dict[str, Any]:
     }
 
 
+def _reported_dtype(dtype) -> str:
+    """
+    Name of a column's dtype as shown in mismatch reports.
+    
+    load_csv stores columns in compact dtypes whose width depends on the values
+    (int8, float32, category), so numbers are reported as int64/float64 and
+    categoricals by their categories' dtype, as pd.read_csv would have parsed them.
+    """
+    if isinstance(dtype, pd.CategoricalDtype):
+        return str(dtype.categories.dtype)
+    if isinstance(dtype, np.dtype) and dtype.kind in 'iuf':
+        return {'i': 'int64', 'u': 'uint64', 'f': 'float64'}[dtype.kind]
+    return str(dtype)
+
+
 def check_data_types(df: pd.DataFrame, schema: Dict[str, str]) -> Dict[str, Any]:
     """
     Validate DataFrame column types against expected schema.
-    Now includes content validation to catch invalid values within columns.
+    Now includes content validation to catch invalid values within columns whose
+    dtype does not already guarantee them (object-dtype or mismatched columns).
     
     Args:
         df: DataFrame to validate
@@ -42,42 +159,107 @@ def check_data_types(df: pd.DataFrame, schema: Dict[str, str]) -> Dict[str, Any]
     Returns:
         Dict containing validation results and mismatched columns
     """
-    type_mapping = {
-        'int': ['int64', 'int32', 'Int64', 'Int32'],
-        'float': ['float64', 'float32'],
-        'str': ['object', 'string'],
-        'bool': ['bool'],
-        'datetime': ['datetime64[ns]', 'datetime64']
-    }
-    
     mismatches = {}
     missing_columns = []
     content_issues = {}
     
-    for column, expected_type in schema.items():
-        if column not in df.columns:
-            missing_columns.append(column)
-            continue
-            
-        actual_type = str(df[column].dtype)
-        expected_dtypes = type_mapping.get(expected_type, [expected_type])
+    def check_column(item):
+        column, expected_type = item
+        series = df[column]
+        actual_type = str(series.dtype)
+        expected_dtypes = _TYPE_MAPPING.get(expected_type, (expected_type,))
+        mismatch = content_issue = None
         
         # Check pandas dtype mismatch
-        if actual_type not in expected_dtypes:
-            mismatches[column] = {
+        dtype_ok = actual_type in expected_dtypes
+        if not dtype_ok:
+            mismatch = {
                 'expected': expected_type,
-                'actual': actual_type,
-                'sample_values': df[column].head(3).tolist()
+                'actual': _reported_dtype(series.dtype),
+                'sample_values': series.head(3).tolist()
             }
         
-        # Check content validity regardless of pandas dtype
-        invalid_values = _check_content_validity(df[column], expected_type)
-        if invalid_values:
-            content_issues[column] = {
-                'expected_type': expected_type,
-                'invalid_values': invalid_values[:10],  # Limit to first 10
-                'total_invalid': len(invalid_values)
-            }
+        # A native int/float/bool/datetime dtype already guarantees valid content,
+        # so only text (object or categorical) or mismatched columns are scanned value by value
+        if not dtype_ok or actual_type in ('object', 'category'):
+            invalid_values, total_invalid = _check_content_validity(series, expected_type, limit=10)  # Limit to first 10
+            if invalid_values:
+                content_issue = {
+                    'expected_type': expected_type,
+                    'invalid_values': invalid_values,
+                    'total_invalid': total_invalid
+                }
+        
+        return column, mismatch, content_issue
+    
+    present = []
+    for column, expected_type in schema.items():
+        if column in df.columns:
+            present.append((column, expected_type))
+        else:
+            missing_columns.append(column)
+    
+    for column, mismatch, content_issue in _map_columns(check_column, present):
+        if mismatch is not None:
+            mismatches[column] = mismatch
+        if content_issue is not None:
+            content_issues[column] = content_issue
+    
+    total_issues = len(mismatches) + len(content_issues)
+    passed = total_issues == 0 and len(missing_columns) == 0
+    
+    return {
+        'check_type': 'data_types',
+        'passed': passed,
+        'mismatches': mismatches,
+        'content_issues': content_issues,
+        'missing_columns': missing_columns,
+        'message': f"Data type check {'passed' if passed else 'failed'}: {len(mismatches)} dtype mismatches, {len(content_issues)} content issues, {len(missing_columns)} missing columns"
+    }
+
+
+def check_data_types_chunked(
+    data: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+    schema: Dict[str, str],
+    chunksize: int = 100_000
+) -> Dict[str, Any]:
+    """
+    Memory-bounded variant of check_data_types for frames too large to check at once.
+    
+    Each chunk is checked on its own and the results are merged, keeping the first
+    dtype mismatch per column and the first 10 invalid values. Dtypes are judged per
+    chunk, so a column that pandas parses differently in different chunks is reported
+    by the first chunk that mismatches.
+    
+    Args:
+        data: DataFrame (checked in row slices) or iterable of DataFrame chunks,
+              e.g. pd.read_csv(path, chunksize=n)
+        schema: Dictionary mapping column names to expected types
+        chunksize: Rows per slice when data is a DataFrame
+        
+    Returns:
+        Dict containing validation results and mismatched columns, as check_data_types
+    """
+    mismatches = {}
+    missing_columns = []
+    content_issues = {}
+    
+    for chunk_number, chunk in enumerate(_iter_chunks(data, chunksize)):
+        chunk_result = check_data_types(chunk, schema)
+        if chunk_number == 0:
+            missing_columns = chunk_result['missing_columns']
+        
+        for column, mismatch in chunk_result['mismatches'].items():
+            mismatches.setdefault(column, mismatch)
+        
+        for column, chunk_issue in chunk_result['content_issues'].items():
+            merged = content_issues.setdefault(column, {
+                'expected_type': chunk_issue['expected_type'],
+                'invalid_values': [],
+                'total_invalid': 0
+            })
+            merged['total_invalid'] += chunk_issue['total_invalid']
+            merged['invalid_values'].extend(chunk_issue['invalid_values'][:10 - len(merged['invalid_values'])])
     
     total_issues = len(mismatches) + len(content_issues)
     passed = total_issues == 0 and len(missing_columns) == 0
@@ -92,7 +274,7 @@ def check_data_types(df: pd.DataFrame, schema: Dict[str, str]) -> Dict[str, Any]
     }
 
 
-def check_value_ranges(df: pd.DataFrame, rules: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+def check_value_ranges(df: pd.DataFrame, rules: Dict[str, Dict[str, Any]], limit: int = 10) -> Dict[str, Any]:
     """
     Check value ranges for numeric columns and allowed values for categorical columns.
     
@@ -103,73 +285,70 @@ def check_value_ranges(df: pd.DataFrame, rules: Dict[str, Dict[str, Any]]) -> Di
                - 'min': minimum allowed value (numeric)
                - 'max': maximum allowed value (numeric)
                - 'allowed': list of allowed values (categorical)
+        limit: Maximum number of violating rows to report per column; counts are exact
                
     Returns:
         Dict containing validation results and violations
     """
-    violations = {}
-    
-    for column, rule_set in rules.items():
+    def check_column(item):
+        column, rule_set = item
         if column not in df.columns:
-            violations[column] = {
+            return column, {
                 'error': f"Column '{column}' not found in DataFrame",
                 'violation_count': 0,
                 'violating_rows': []
             }
-            continue
             
-        column_violations = []
+        series = df[column]
+        rule_masks = []
+        
+        # Plain NumPy numeric columns are compared without the pandas layer
+        if isinstance(series.dtype, np.dtype) and pd.api.types.is_numeric_dtype(series.dtype):
+            values = series.to_numpy()
+        else:
+            values = series
         
         # Check numeric range constraints
         if 'min' in rule_set:
             min_val = rule_set['min']
-            mask = df[column] < min_val
-            if mask.any():
-                violating_indices = df[mask].index.tolist()
-                column_violations.extend([
-                    {
-                        'row_index': idx,
-                        'value': df.loc[idx, column],
-                        'rule_violated': f'min_value >= {min_val}'
-                    }
-                    for idx in violating_indices
-                ])
+            rule_masks.append((values < min_val, f'min_value >= {min_val}'))
         
         if 'max' in rule_set:
             max_val = rule_set['max']
-            mask = df[column] > max_val
-            if mask.any():
-                violating_indices = df[mask].index.tolist()
-                column_violations.extend([
-                    {
-                        'row_index': idx,
-                        'value': df.loc[idx, column],
-                        'rule_violated': f'max_value <= {max_val}'
-                    }
-                    for idx in violating_indices
-                ])
+            rule_masks.append((values > max_val, f'max_value <= {max_val}'))
         
         # Check allowed values (categorical)
         if 'allowed' in rule_set:
             allowed_vals = rule_set['allowed']
-            mask = ~df[column].isin(allowed_vals)
-            if mask.any():
-                violating_indices = df[mask].index.tolist()
-                column_violations.extend([
-                    {
-                        'row_index': idx,
-                        'value': df.loc[idx, column],
-                        'rule_violated': f'value must be in {allowed_vals}'
-                    }
-                    for idx in violating_indices
-                ])
-        
-        if column_violations:
-            violations[column] = {
-                'violation_count': len(column_violations),
-                'violating_rows': column_violations[:10],  # Limit to first 10 for readability
-                'total_violations': len(column_violations)
-            }
+            rule_masks.append((~series.isin(allowed_vals), f'value must be in {allowed_vals}'))
+        
+        # Count every violation, but only materialize the rows shown in the report
+        column_violations = []
+        violation_count = 0
+        for mask, rule_violated in rule_masks:
+            if isinstance(mask, pd.Series):
+                mask = mask.to_numpy(dtype=bool, na_value=False)
+            positions = np.flatnonzero(mask)
+            violation_count += len(positions)
+            shown = positions[:limit - len(column_violations)]
+            column_violations.extend(
+                {'row_index': idx, 'value': value, 'rule_violated': rule_violated}
+                for idx, value in zip(series.index[shown].tolist(), series.iloc[shown].tolist())
+            )
+        
+        if not violation_count:
+            return column, None
+        return column, {
+            'violation_count': violation_count,
+            'violating_rows': column_violations,  # Limited to first `limit` for readability
+            'total_violations': violation_count
+        }
+    
+    violations = {
+        column: column_result
+        for column, column_result in _map_columns(check_column, list(rules.items()))
+        if column_result is not None
+    }
     
     total_violations = sum(v.get('violation_count', 0) for v in violations.values())
     passed = total_violations == 0
@@ -183,45 +362,134 @@ def check_value_ranges(df: pd.DataFrame, rules: Dict[str, Dict[str, Any]]) -> Di
     }
 
 
-def _check_content_validity(series: pd.Series, expected_type: str) -> List[Dict[str, Any]]:
+def check_value_ranges_chunked(
+    data: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+    rules: Dict[str, Dict[str, Any]],
+    chunksize: int = 100_000,
+    limit: int = 10
+) -> Dict[str, Any]:
+    """
+    Memory-bounded variant of check_value_ranges for frames too large to check at once.
+    
+    Only the violation counts and the first `limit` violating rows are kept between
+    chunks, so peak memory follows the chunk size rather than the number of rows.
+    Reported rows are the first in row order, not grouped by rule as check_value_ranges does.
+    check_data_types_chunked and check_data_consistency_chunked follow the same
+    data/chunksize contract; run_quality_checks(chunksize=...) streams all three.
+    
+    Args:
+        data: DataFrame (checked in row slices) or iterable of DataFrame chunks,
+              e.g. pd.read_csv(path, chunksize=n)
+        rules: Dictionary mapping column names to validation rules
+        chunksize: Rows per slice when data is a DataFrame
+        limit: Maximum number of violating rows to report per column
+        
+    Returns:
+        Dict containing validation results and violations, as check_value_ranges
+    """
+    violations = {}
+    
+    for chunk in _iter_chunks(data, chunksize):
+        chunk_result = check_value_ranges(chunk, rules, limit)
+        for column, chunk_violations in chunk_result['violations'].items():
+            if 'error' in chunk_violations:
+                violations[column] = chunk_violations
+                continue
+            
+            merged = violations.setdefault(column, {
+                'violation_count': 0,
+                'violating_rows': [],
+                'total_violations': 0
+            })
+            merged['violation_count'] += chunk_violations['violation_count']
+            merged['total_violations'] += chunk_violations['total_violations']
+            merged['violating_rows'].extend(chunk_violations['violating_rows'][:limit - len(merged['violating_rows'])])
+    
+    total_violations = sum(v.get('violation_count', 0) for v in violations.values())
+    passed = total_violations == 0
+    
+    return {
+        'check_type': 'value_ranges',
+        'passed': passed,
+        'violations': violations,
+        'total_violations': total_violations,
+        'message': f"Value range check {'passed' if passed else 'failed'}: {total_violations} total violations across {len(violations)} columns"
+    }
+
+
+def _match_mask(values: pd.Series, pattern: str) -> np.ndarray:
+    """Boolean array marking string values that match pattern, via Arrow's native regex when available."""
+    if pc is not None:
+        matches = pc.match_substring_regex(pa.array(values, type=pa.string()), pattern)
+        return matches.to_numpy(zero_copy_only=False)
+    return values.str.match(pattern).to_numpy(dtype=bool)
+
+
+def _check_content_validity(series: pd.Series, expected_type: str, limit: int = 10) -> Tuple[List[Dict[str, Any]], int]:
     """
     Check if the actual content of a series matches the expected data type.
     
+    Values that plainly match the type (e.g. ASCII digits for int) are accepted in one
+    vectorized pass; the rest are validated once per distinct value and the verdicts
+    are mapped back onto the column.
+    
     Args:
         series: Pandas series to validate
         expected_type: Expected data type (int, float, str, bool, datetime)
+        limit: Maximum number of invalid values to return details for
         
     Returns:
-        List of invalid values with their row indices
+        Tuple of (first `limit` invalid values with their row indices, total invalid count)
     """
-    invalid_values = []
-    
-    for idx, value in series.items():
-        # Skip NaN values as they're handled separately
-        if pd.isna(value):
-            continue
-            
-        value_str = str(value).strip()
-        is_valid = True
-        
-        if expected_type == 'int':
-            is_valid = _is_valid_integer(value_str)
-        elif expected_type == 'float':
-            is_valid = _is_valid_float(value_str)
-        elif expected_type == 'datetime':
-            is_valid = _is_valid_date(value_str)
-        elif expected_type == 'bool':
-            is_valid = _is_valid_boolean(value_str)
+    type_flag = _TYPE_FLAGS.get(expected_type)
+    if type_flag is None:
         # For 'str' type, everything is valid
-        
-        if not is_valid:
-            invalid_values.append({
-                'row_index': int(idx),
-                'value': value,
-                'issue': f'Invalid {expected_type}: "{value_str}"'
-            })
+        return [], 0
+    
+    # Skip NaN values as they're handled separately
+    values = series.dropna()
+    
+    candidate_positions = np.arange(len(values))
+    if pd.api.types.is_numeric_dtype(values.dtype):
+        # Homogeneous numbers/bools: validate the distinct raw values
+        keys = values
+    else:
+        keys = values.astype(str)
+        pattern = _FAST_ACCEPT_PATTERNS.get(expected_type)
+        if pattern is not None and len(keys) > 0:
+            accepted = _match_mask(keys, pattern)
+            if expected_type == 'datetime':
+                # The ISO shape does not rule out e.g. 2025-02-30; pandas parses the
+                # matching rows in one pass (out-of-range years fall back to strptime)
+                shaped = np.flatnonzero(accepted)
+                accepted = np.zeros(len(keys), dtype=bool)
+                accepted[shaped] = pd.to_datetime(keys.iloc[shaped], format='%Y-%m-%d', errors='coerce').notna().to_numpy()
+            candidate_positions = np.flatnonzero(~accepted)
+    
+    # Validate each distinct candidate once and map the verdicts back through the codes
+    codes, uniques = pd.factorize(keys.iloc[candidate_positions])
+    verdicts = np.fromiter(
+        (_value_flags(str(key).strip()) & type_flag for key in uniques.tolist()),
+        dtype=bool,
+        count=len(uniques)
+    )
+    invalid_positions = candidate_positions[~verdicts[codes]]
+    if len(invalid_positions) == 0:
+        return [], 0
     
-    return invalid_values
+    # Only the reported rows are materialized; the total comes from the mask
+    invalid = values.iloc[invalid_positions[:limit]]
+    
+    # tolist() yields Python scalars, matching what series.items() used to produce
+    invalid_values = [
+        {
+            'row_index': int(idx),
+            'value': value,
+            'issue': f'Invalid {expected_type}: "{str(value).strip()}"'
+        }
+        for idx, value in zip(invalid.index, invalid.tolist())
+    ]
+    return invalid_values, len(invalid_positions)
 
 
 def _is_valid_integer(value_str: str) -> bool:
@@ -244,36 +512,84 @@ def _is_valid_float(value_str: str) -> bool:
 
 def _is_valid_date(value_str: str) -> bool:
     """Check if string represents a valid date."""
-    # Common date patterns
-    date_patterns = [
-        r'^\d{4}-\d{2}-\d{2}$',  # YYYY-MM-DD
-        r'^\d{2}/\d{2}/\d{4}$',  # MM/DD/YYYY
-        r'^\d{2}-\d{2}-\d{4}$',  # MM-DD-YYYY
-        r'^\d{4}/\d{2}/\d{2}$',  # YYYY/MM/DD
-    ]
-    
-    # First check if it matches common date patterns
-    for pattern in date_patterns:
-        if re.match(pattern, value_str):
-            # Try to parse it
+    # Only the format paired with the matching shape can parse the value
+    for pattern, fmt in _DATE_FORMATS:
+        if pattern.match(value_str):
             try:
-                # Try multiple date formats
-                for fmt in ['%Y-%m-%d', '%m/%d/%Y', '%m-%d-%Y', '%Y/%m/%d']:
-                    try:
-                        datetime.strptime(value_str, fmt)
-                        return True
-                    except ValueError:
-                        continue
+                datetime.strptime(value_str, fmt)
+                return True
             except ValueError:
-                pass
+                return False
     
     return False
 
 
 def _is_valid_boolean(value_str: str) -> bool:
     """Check if string represents a valid boolean."""
-    valid_bools = {'true', 'false', '1', '0', 'yes', 'no', 'y', 'n', 't', 'f'}
-    return value_str.lower() in valid_bools
+    return value_str.lower() in _VALID_BOOLS
+
+
+def _value_flags(value_str: str) -> int:
+    """
+    Bitmask of the types a stripped value string parses as.
+    
+    Content validation, the mixed-type check and type inference all classify the
+    same cell strings, so short verdicts are memoized once and shared between them.
+    """
+    if len(value_str) > _VALUE_FLAGS_MAX_CACHED_LEN:
+        return _classify_value(value_str)
+    return _cached_value_flags(value_str)
+
+
+@lru_cache(maxsize=1 << 16)
+def _cached_value_flags(value_str: str) -> int:
+    """Memoized _classify_value for short strings."""
+    return _classify_value(value_str)
+
+
+def _classify_value(value_str: str) -> int:
+    """Compute the type bitmask of a stripped value string."""
+    flags = 0
+    if _is_valid_integer(value_str):
+        flags |= _INT
+    if _is_valid_float(value_str):
+        flags |= _FLOAT
+    if _is_valid_date(value_str):
+        flags |= _DATE
+    if _is_valid_boolean(value_str):
+        flags |= _BOOL
+    return flags
+
+
+def _string_flags(values: pd.Series) -> np.ndarray:
+    """Per-row type flags of non-null values, classified once per distinct string."""
+    codes, uniques = pd.factorize(values.astype(str))
+    return _distinct_flags(uniques)[codes]
+
+
+def _distinct_flags(uniques: pd.Index) -> np.ndarray:
+    """Type flags for each of a column's distinct (unstripped) strings."""
+    flags = np.zeros(len(uniques), dtype=np.uint8)
+    if len(uniques) == 0:
+        return flags
+    
+    # Plain numbers are settled in bulk by the native regex: ASCII integers parse as
+    # int and float (and 0/1 as bool), other plain decimals only as float
+    unique_strings = pd.Series(uniques, dtype=object)
+    int_shaped = _match_mask(unique_strings, _FAST_ACCEPT_PATTERNS['int'])
+    float_shaped = ~int_shaped & _match_mask(unique_strings, _FAST_ACCEPT_PATTERNS['float'])
+    flags[int_shaped] = _INT | _FLOAT
+    flags[int_shaped & _match_mask(unique_strings, r'^\s*[01]\s*$')] |= _BOOL
+    flags[float_shaped] = _FLOAT
+    
+    # Everything else goes through the exact validators
+    rest = np.flatnonzero(~(int_shaped | float_shaped))
+    flags[rest] = np.fromiter(
+        (_value_flags(value.strip()) for value in unique_strings.iloc[rest].tolist()),
+        dtype=np.uint8,
+        count=len(rest)
+    )
+    return flags
 
 
 def check_data_consistency(df: pd.DataFrame) -> Dict[str, Any]:
@@ -287,13 +603,16 @@ def check_data_consistency(df: pd.DataFrame) -> Dict[str, Any]:
     Returns:
         Dict containing consistency check results
     """
-    issues = {}
-    
-    for column in df.columns:
+    def check_column(column):
         column_issues = []
+        series = df[column]
+        
+        # One null mask serves the missing count, the non-null values and their count
+        null_mask = series.isna().to_numpy()
+        missing_count = int(np.count_nonzero(null_mask))
+        total_values = len(series) - missing_count
         
         # Check for missing values
-        missing_count = df[column].isna().sum()
         if missing_count > 0:
             column_issues.append({
                 'type': 'missing_values',
@@ -301,17 +620,16 @@ def check_data_consistency(df: pd.DataFrame) -> Dict[str, Any]:
                 'percentage': round(missing_count / len(df) * 100, 2)
             })
         
+        # An all-null column has nothing left to compare
+        if total_values == 0:
+            return column, column_issues
+        
         # Check for mixed data types (numeric and text mixed)
-        if df[column].dtype == 'object':
-            numeric_count = 0
-            text_count = 0
-            
-            for value in df[column].dropna():
-                value_str = str(value).strip()
-                if _is_valid_float(value_str):
-                    numeric_count += 1
-                else:
-                    text_count += 1
+        non_null = series[~null_mask]
+        if series.dtype == 'object' or isinstance(series.dtype, pd.CategoricalDtype):
+            flags = _string_flags(non_null)
+            numeric_count = int(np.count_nonzero(flags & _FLOAT))
+            text_count = len(flags) - numeric_count
             
             if numeric_count > 0 and text_count > 0:
                 column_issues.append({
@@ -321,11 +639,110 @@ def check_data_consistency(df: pd.DataFrame) -> Dict[str, Any]:
                     'suggestion': 'Column contains both numeric and text values'
                 })
         
-        # Check for suspicious patterns
-        unique_values = df[column].nunique()
-        total_values = len(df[column].dropna())
+        # Check for suspicious patterns: comparing against the first value is a single
+        # vectorized pass, where nunique() would hash the whole column
+        if total_values > 1 and (non_null == non_null.iloc[0]).all():
+            column_issues.append({
+                'type': 'constant_values',
+                'message': 'All non-null values are identical'
+            })
+        
+        return column, column_issues
+    
+    # A frame without rows has no values to be inconsistent
+    columns = list(df.columns) if len(df) > 0 else []
+    issues = {
+        column: column_issues
+        for column, column_issues in _map_columns(check_column, columns)
+        if column_issues
+    }
+    
+    passed = len(issues) == 0
+    total_issues = sum(len(col_issues) for col_issues in issues.values())
+    
+    return {
+        'check_type': 'data_consistency',
+        'passed': passed,
+        'issues': issues,
+        'total_issues': total_issues,
+        'message': f"Data consistency check {'passed' if passed else 'failed'}: {total_issues} issues found across {len(issues)} columns"
+    }
+
+
+def check_data_consistency_chunked(
+    data: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+    chunksize: int = 100_000
+) -> Dict[str, Any]:
+    """
+    Memory-bounded variant of check_data_consistency for frames too large to check at once.
+    
+    Only per-column counters and the first non-null value are kept between chunks, so
+    peak memory follows the chunk size rather than the number of rows. Mixed types are
+    counted across chunks, so a column that read_csv parsed as numbers in some chunks
+    and as text in others is still reported. Like the range and data type variants, it
+    accepts a DataFrame or any iterable of chunks.
+    
+    Args:
+        data: DataFrame (checked in row slices) or iterable of DataFrame chunks,
+              e.g. pd.read_csv(path, chunksize=n)
+        chunksize: Rows per slice when data is a DataFrame
+        
+    Returns:
+        Dict containing consistency check results, as check_data_consistency
+    """
+    stats = {}
+    total_rows = 0
+    
+    for chunk in _iter_chunks(data, chunksize):
+        total_rows += len(chunk)
+        for column in chunk.columns:
+            series = chunk[column]
+            column_stats = stats.setdefault(column, {
+                'missing': 0, 'non_null': 0, 'numeric': 0, 'text': 0, 'first': None, 'constant': True
+            })
+            
+            null_mask = series.isna().to_numpy()
+            non_null = series[~null_mask]
+            column_stats['missing'] += int(np.count_nonzero(null_mask))
+            if len(non_null) == 0:
+                continue
+            
+            if series.dtype == 'object' or isinstance(series.dtype, pd.CategoricalDtype):
+                flags = _string_flags(non_null)
+                numeric_count = int(np.count_nonzero(flags & _FLOAT))
+                column_stats['numeric'] += numeric_count
+                column_stats['text'] += len(flags) - numeric_count
+            elif pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype):
+                # A chunk pandas parsed as numbers holds only numeric values; counting them
+                # catches text that turns up in another chunk of the same column
+                column_stats['numeric'] += len(non_null)
+            
+            if column_stats['non_null'] == 0:
+                column_stats['first'] = non_null.iloc[0]
+            if column_stats['constant']:
+                column_stats['constant'] = bool((non_null == column_stats['first']).all())
+            column_stats['non_null'] += len(non_null)
+    
+    issues = {}
+    for column, column_stats in stats.items():
+        column_issues = []
         
-        if unique_values == 1 and total_values > 1:
+        if column_stats['missing'] > 0:
+            column_issues.append({
+                'type': 'missing_values',
+                'count': column_stats['missing'],
+                'percentage': round(column_stats['missing'] / total_rows * 100, 2)
+            })
+        
+        if column_stats['numeric'] > 0 and column_stats['text'] > 0:
+            column_issues.append({
+                'type': 'mixed_types',
+                'numeric_values': column_stats['numeric'],
+                'text_values': column_stats['text'],
+                'suggestion': 'Column contains both numeric and text values'
+            })
+        
+        if column_stats['non_null'] > 1 and column_stats['constant']:
             column_issues.append({
                 'type': 'constant_values',
                 'message': 'All non-null values are identical'
@@ -346,23 +763,77 @@ def check_data_consistency(df: pd.DataFrame) -> Dict[str, Any]:
     }
 
 
-def infer_column_types(df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
+def _classify_values(non_null_values: pd.Series) -> tuple:
+    """
+    Classify each non-null value of a column into a pattern bucket.
+    
+    Each distinct string is classified once and the result is mapped back onto the
+    rows, so the per-row work is vectorized.
+    
+    Args:
+        non_null_values: Column values with nulls dropped
+        
+    Returns:
+        Tuple of (pattern counts, per-row codes into _CLASSIFICATIONS,
+        dominant structured pattern)
+    """
+    structured_pattern = None
+    
+    # Numeric dtypes settle every value at once: str() of an int always parses as an
+    # integer, and str() of a float always has a '.', exponent, or inf, so it is a float
+    if pd.api.types.is_integer_dtype(non_null_values.dtype):
+        classes = np.full(len(non_null_values), _CLASSIFICATIONS.index('integer'), dtype=np.uint8)
+    elif pd.api.types.is_float_dtype(non_null_values.dtype):
+        classes = np.full(len(non_null_values), _CLASSIFICATIONS.index('float'), dtype=np.uint8)
+    else:
+        codes, uniques = pd.factorize(non_null_values.astype(str))
+        stripped = [value.strip() for value in uniques.tolist()]
+        counts = np.bincount(codes, minlength=len(uniques))
+        
+        # First pass: detect if there's a common structured pattern (like "number/number")
+        for pattern_key, regex in _STRUCTURED_PATTERNS.items():
+            matches = np.fromiter((regex.match(value) is not None for value in stripped), dtype=bool, count=len(stripped))
+            if counts[matches].sum() >= len(non_null_values) * 0.7:  # 70% threshold
+                structured_pattern = pattern_key
+        
+        # Second pass: classify each distinct value, first matching bucket wins
+        flags = _distinct_flags(uniques)
+        is_structured = np.fromiter(
+            (structured_pattern is not None and _matches_structured_pattern(value, structured_pattern) for value in stripped),
+            dtype=bool,
+            count=len(stripped)
+        )
+        is_short = np.fromiter((len(value) <= 3 and value.isalpha() for value in stripped), dtype=bool, count=len(stripped))  # Short alphabetic codes
+        unique_classes = np.select(
+            [flags & _INT != 0, flags & _FLOAT != 0, flags & _DATE != 0, is_structured, is_short],
+            [0, 1, 2, 3, 4],
+            default=5
+        ).astype(np.uint8)
+        classes = unique_classes[codes]
+    
+    counts = np.bincount(classes, minlength=len(_CLASSIFICATIONS))
+    patterns = dict(zip(_CLASSIFICATIONS, counts.tolist()))
+    return patterns, classes, structured_pattern
+
+
+def infer_column_types(df: pd.DataFrame, limit: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
     """
     Automatically infer the expected data type for each column based on the data patterns.
     
     Args:
         df: DataFrame to analyze
+        limit: Maximum number of outliers to report per column (all when None);
+               outlier_count is always exact
         
     Returns:
         Dict mapping column names to inferred type info and outliers
     """
-    column_analysis = {}
-    
-    for column in df.columns:
+    def analyze_column(column):
         analysis = {
             'inferred_type': 'str',  # default
             'confidence': 0.0,
             'outliers': [],
+            'outlier_count': 0,
             'patterns': {},
             'sample_values': df[column].dropna().head(5).tolist()
         }
@@ -370,71 +841,9 @@ def infer_column_types(df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
         # Get non-null values
         non_null_values = df[column].dropna()
         if len(non_null_values) == 0:
-            column_analysis[column] = analysis
-            continue
-        
-        # Enhanced pattern detection
-        patterns = {
-            'integer': 0,
-            'float': 0, 
-            'date': 0,
-            'structured_text': 0,  # NEW: for patterns like "120/80"
-            'short_categorical': 0,  # NEW: for short codes like M/F
-            'text': 0
-        }
+            return analysis
         
-        value_classifications = []
-        structured_pattern = None
-        
-        # First pass: detect if there's a common structured pattern
-        structured_patterns = {}
-        for idx, value in non_null_values.items():
-            value_str = str(value).strip()
-            
-            # Check for structured patterns (like "number/number")
-            if re.match(r'^\d+/\d+$', value_str):
-                pattern_key = 'number/number'
-                structured_patterns[pattern_key] = structured_patterns.get(pattern_key, 0) + 1
-            elif re.match(r'^[A-Z][0-9]+$', value_str):  # Like P001
-                pattern_key = 'letter+digits'
-                structured_patterns[pattern_key] = structured_patterns.get(pattern_key, 0) + 1
-        
-        # Find most common structured pattern
-        if structured_patterns:
-            dominant_pattern = max(structured_patterns.items(), key=lambda x: x[1])
-            if dominant_pattern[1] >= len(non_null_values) * 0.7:  # 70% threshold
-                structured_pattern = dominant_pattern[0]
-        
-        # Second pass: classify each value
-        for idx, value in non_null_values.items():
-            value_str = str(value).strip()
-            classification = 'text'  # default
-            
-            if _is_valid_integer(value_str):
-                classification = 'integer'
-                patterns['integer'] += 1
-            elif _is_valid_float(value_str):
-                classification = 'float'
-                patterns['float'] += 1
-            elif _is_valid_date(value_str):
-                classification = 'date'
-                patterns['date'] += 1
-            elif structured_pattern and _matches_structured_pattern(value_str, structured_pattern):
-                classification = 'structured_text'
-                patterns['structured_text'] += 1
-            elif len(value_str) <= 3 and value_str.isalpha():  # Short alphabetic codes
-                classification = 'short_categorical'
-                patterns['short_categorical'] += 1
-            else:
-                classification = 'text'
-                patterns['text'] += 1
-            
-            value_classifications.append({
-                'index': idx,
-                'value': value,
-                'classification': classification,
-                'structured_pattern': structured_pattern if classification == 'structured_text' else None
-            })
+        patterns, classes, structured_pattern = _classify_values(non_null_values)
         
         # Determine most likely type
         total_values = len(non_null_values)
@@ -463,21 +872,25 @@ def infer_column_types(df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
             
             # Find outliers based on inferred type
             expected_classification = dominant_type[0]
-            for item in value_classifications:
-                if item['classification'] != expected_classification:
-                    # Special handling for structured text
-                    if expected_classification == 'structured_text':
-                        issue_msg = f"Expected {structured_pattern} pattern but found: '{item['value']}'"
-                    else:
-                        issue_msg = f"Expected {analysis['inferred_type']} but found {item['classification']}: '{item['value']}'"
-                    
-                    analysis['outliers'].append({
-                        'row_index': int(item['index']),
-                        'value': item['value'],
-                        'expected_type': analysis['inferred_type'],
-                        'actual_classification': item['classification'],
-                        'issue': issue_msg
-                    })
+            outlier_positions = np.flatnonzero(classes != _CLASSIFICATIONS.index(expected_classification))
+            analysis['outlier_count'] = len(outlier_positions)
+            outlier_positions = outlier_positions[:limit]
+            outliers = non_null_values.iloc[outlier_positions]
+            for idx, value, code in zip(outliers.index, outliers.tolist(), classes[outlier_positions].tolist()):
+                classification = _CLASSIFICATIONS[code]
+                # Special handling for structured text
+                if expected_classification == 'structured_text':
+                    issue_msg = f"Expected {structured_pattern} pattern but found: '{value}'"
+                else:
+                    issue_msg = f"Expected {analysis['inferred_type']} but found {classification}: '{value}'"
+                
+                analysis['outliers'].append({
+                    'row_index': int(idx),
+                    'value': value,
+                    'expected_type': analysis['inferred_type'],
+                    'actual_classification': classification,
+                    'issue': issue_msg
+                })
         else:
             # Mixed types - default to text but still report inconsistencies
             analysis['inferred_type'] = 'str'
@@ -488,38 +901,70 @@ def infer_column_types(df: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
         
         analysis['patterns'] = patterns
         analysis['type_percentages'] = type_percentages
-        column_analysis[column] = analysis
+        return analysis
     
-    return column_analysis
+    def cached_analysis(column):
+        series = df[column]
+        if len(series) < _INFERENCE_CACHE_MIN_ROWS:
+            return analyze_column(column)
+        
+        key = _column_fingerprint(series)
+        if key is None:
+            return analyze_column(column)
+        key = (key, limit)
+        with _inference_cache_lock:
+            cached = _inference_cache.get(key)
+            if cached is not None:
+                _inference_cache.move_to_end(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
+        analysis = analyze_column(column)
+        with _inference_cache_lock:
+            _inference_cache[key] = copy.deepcopy(analysis)
+            if len(_inference_cache) > _INFERENCE_CACHE_SIZE:
+                _inference_cache.popitem(last=False)
+        return analysis
+    
+    columns = list(df.columns)
+    return dict(zip(columns, _map_columns(cached_analysis, columns)))
+
+
+def _column_fingerprint(series: pd.Series) -> Optional[tuple]:
+    """Content key for a column's inference result, or None if its values cannot be hashed."""
+    try:
+        hashes = pd.util.hash_pandas_object(series, index=True).to_numpy()
+    except TypeError:
+        return None
+    return str(series.dtype), len(series), hashlib.blake2b(hashes.tobytes(), digest_size=16).digest()
 
 
 def _matches_structured_pattern(value_str: str, pattern: str) -> bool:
     """Check if a value matches a specific structured pattern."""
-    if pattern == 'number/number':
-        return bool(re.match(r'^\d+/\d+$', value_str))
-    elif pattern == 'letter+digits':
-        return bool(re.match(r'^[A-Z][0-9]+$', value_str))
-    return False
+    regex = _STRUCTURED_PATTERNS.get(pattern)
+    return regex is not None and regex.match(value_str) is not None
 
 
-def check_automatic_quality(df: pd.DataFrame) -> Dict[str, Any]:
+def check_automatic_quality(df: pd.DataFrame, limit: int = 100) -> Dict[str, Any]:
     """
     Perform automatic data quality checking by inferring expected types 
     and finding outliers/anomalies.
     
     Args:
         df: DataFrame to check
+        limit: Maximum number of outliers to report per column; total_outliers and
+               each column's outlier_count are exact
         
     Returns:
         Dict containing automatic quality check results
     """
-    column_analysis = infer_column_types(df)
+    column_analysis = infer_column_types(df, limit=limit)
     
     total_outliers = 0
     columns_with_issues = 0
     
     for column, analysis in column_analysis.items():
-        outlier_count = len(analysis['outliers'])
+        outlier_count = analysis['outlier_count']
         total_outliers += outlier_count
         if outlier_count > 0:
             columns_with_issues += 1
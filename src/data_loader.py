@@ -1,21 +1,344 @@
 """CSV data loader utility with error handling."""
 
+import csv
+import io
+import json
+import os
+from collections import defaultdict
+import numpy as np
 import pandas as pd
-from typing import Union
+from functools import lru_cache
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Sequence, Tuple, Union
 from pathlib import Path
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    from pyarrow import csv as pacsv
+except ImportError:  # pyarrow ships with streamlit, but keep the loader usable with pandas alone
+    pa = None
+    pq = None
+    pacsv = None
+
+try:
+    import polars as pl
+except ImportError:  # Optional reader, only used when CSV_CHECKER_ENGINE=polars
+    pl = None
+
+
+# Text columns whose distinct values number less than this share of rows are
+# stored as categoricals
+_CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+# pd.read_csv's default missing-value markers and boolean spellings, so the Arrow
+# reader produces the same frame
+_PANDAS_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+]
+_PANDAS_TRUE_VALUES = ['True', 'TRUE', 'true']
+_PANDAS_FALSE_VALUES = ['False', 'FALSE', 'false']
+
 
 class CSVLoadError(Exception):
     """Custom exception for CSV loading failures."""
     pass
 
 
-def load_csv(filepath: Union[str, Path]) -> pd.DataFrame:
+def _optimize_dtypes(df: pd.DataFrame, keep: Sequence[str] = ()) -> pd.DataFrame:
+    """
+    Shrink column dtypes in place without changing any value.
+    
+    Integers are downcast to the narrowest type that holds them, floats become
+    float32 only when every value round-trips exactly, and text columns made mostly
+    of repeated values become categoricals. Extension dtypes and the columns named
+    in keep (dtypes the caller asked for) are left alone.
+    """
+    for position, dtype in enumerate(df.dtypes):
+        if not isinstance(dtype, np.dtype) or df.columns[position] in keep:
+            continue
+        series = df.iloc[:, position]
+        if dtype.kind == 'i':
+            df.isetitem(position, pd.to_numeric(series, downcast='integer'))
+        elif dtype.kind == 'f' and dtype.itemsize > 4:
+            narrowed = series.astype(np.float32)
+            if np.array_equal(narrowed.to_numpy(dtype=np.float64), series.to_numpy(), equal_nan=True):
+                df.isetitem(position, narrowed)
+        elif dtype == object and len(series) > 0:
+            if series.nunique(dropna=False) < len(series) * _CATEGORY_MAX_UNIQUE_RATIO:
+                df.isetitem(position, series.astype('category'))
+    return df
+
+
+def _arrow_column_types(dtype: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Arrow types for the pandas dtypes in dtype that have a direct Arrow equivalent.
+    
+    Text dtypes map to Arrow strings and NumPy dtypes to their Arrow counterpart;
+    anything else is left to Arrow's inference and converted afterwards.
+    """
+    column_types = {}
+    for name, requested in dtype.items():
+        requested = pd.api.types.pandas_dtype(requested)
+        if isinstance(requested, pd.StringDtype) or requested == object:
+            column_types[name] = pa.string()
+        elif isinstance(requested, np.dtype):
+            column_types[name] = pa.from_numpy_dtype(requested)
+    return column_types
+
+
+def _dedupe_names(names: Sequence[str]) -> list:
+    """
+    Make repeated column names unique the way pd.read_csv does: a, a.1, a.2, ...
+    
+    A generated name that is already taken gets the next free suffix instead.
+    """
+    counts = defaultdict(int)
+    unique = []
+    for name in names:
+        count = counts[name]
+        while count > 0:
+            counts[name] = count + 1
+            name = f"{name}.{count}"
+            count = counts[name]
+        unique.append(name)
+        counts[name] = count + 1
+    return unique
+
+
+def _read_with_pyarrow(
+    source: Union[Path, BinaryIO],
+    columns: Optional[Tuple[str, ...]] = None,
+    dtype: Optional[Dict[str, Any]] = None
+) -> pd.DataFrame:
+    """
+    Parse a CSV with Arrow's multi-threaded reader and convert it to pandas.
+    
+    Files on disk are memory-mapped so the reader's threads parse straight from
+    the page cache; file-like objects are read as-is. Quoted newlines are allowed
+    to match pd.read_csv semantics, and so are its missing-value markers and boolean
+    spellings. Arrow infers dates and times where pandas keeps the text, so columns
+    inferred as temporal are read again as strings. Repeated header names are renamed
+    as pandas does (a, a.1). Columns named in dtype are converted straight to that type
+    instead of being inferred. The Arrow table is released column by column during
+    conversion so two copies are never held.
+    """
+    read_options = pacsv.ReadOptions(use_threads=True, block_size=1 << 20)
+    parse_options = pacsv.ParseOptions(newlines_in_values=True)
+    column_types = _arrow_column_types(dtype) if dtype else {}
+    start = None if isinstance(source, Path) else source.tell()
+    
+    def read(column_types):
+        convert_options = pacsv.ConvertOptions(
+            include_columns=list(columns) if columns is not None else None,
+            column_types=column_types,
+            null_values=_PANDAS_NA_VALUES,
+            strings_can_be_null=True,
+            true_values=_PANDAS_TRUE_VALUES,
+            false_values=_PANDAS_FALSE_VALUES
+        )
+        if start is None:
+            with pa.memory_map(str(source)) as mapped:
+                return pacsv.read_csv(mapped, read_options=read_options, parse_options=parse_options, convert_options=convert_options)
+        source.seek(start)
+        return pacsv.read_csv(source, read_options=read_options, parse_options=parse_options, convert_options=convert_options)
+    
+    table = read(column_types)
+    temporal = [field.name for field in table.schema if pa.types.is_temporal(field.type) and field.name not in column_types]
+    if temporal:
+        del table
+        table = read({**column_types, **{name: pa.string() for name in temporal}})
+    
+    # An all-missing column is float64 NaN in pandas, not None objects
+    for position, field in enumerate(table.schema):
+        if pa.types.is_null(field.type):
+            table = table.set_column(position, field.name, pa.nulls(table.num_rows, pa.float64()))
+    if len(set(table.column_names)) < table.num_columns:
+        table = table.rename_columns(_dedupe_names(table.column_names))
+    
+    # Missing text converts to None; pandas marks it with NaN
+    text_with_nulls = [
+        position for position, column in enumerate(table.columns)
+        if pa.types.is_string(column.type) and column.null_count
+    ]
+    df = table.to_pandas(split_blocks=True, self_destruct=True)
+    for position in text_with_nulls:
+        series = df.iloc[:, position]
+        df.isetitem(position, series.where(series.notna(), np.nan))
+    return df
+
+
+def _read_with_polars(source: Union[Path, BinaryIO], columns: Optional[Tuple[str, ...]] = None) -> pd.DataFrame:
+    """
+    Parse a CSV with Polars' multi-threaded reader and convert it to pandas.
+    
+    The whole file is used for schema inference, like pd.read_csv(low_memory=False).
+    Conversion yields NumPy-backed columns so text stays object dtype for the checks.
+    """
+    return pl.read_csv(
+        source,
+        columns=list(columns) if columns is not None else None,
+        rechunk=False,
+        infer_schema_length=None
+    ).to_pandas()
+
+
+def _read_with_pandas(
+    source: Union[Path, BinaryIO],
+    columns: Optional[Tuple[str, ...]] = None,
+    dtype: Optional[Dict[str, Any]] = None
+) -> pd.DataFrame:
+    """Parse a CSV with pd.read_csv, inferring each column's dtype from the whole file rather than per chunk."""
+    return pd.read_csv(source, low_memory=False, usecols=list(columns) if columns is not None else None, dtype=dtype)
+
+
+def _parse_csv(
+    source: Union[Path, BinaryIO],
+    engine: str,
+    columns: Optional[Tuple[str, ...]] = None,
+    dtype: Optional[Dict[str, Any]] = None
+) -> pd.DataFrame:
+    """
+    Parse a CSV with the selected engine, or the best available default, into compact dtypes.
+    
+    When columns is given (header names, in file order) only those are converted.
+    Columns named in dtype end up with exactly that dtype and are not compacted.
+    Files with rows of differing field counts, which Arrow rejects outright, are
+    re-read with pd.read_csv so short rows are padded with NaN as before.
+    """
+    start = None if isinstance(source, Path) else source.tell()
+    if engine == 'polars':
+        df = _read_with_polars(source, columns)
+    elif pacsv is not None:
+        try:
+            df = _read_with_pyarrow(source, columns, dtype)
+        except pa.ArrowInvalid as e:
+            if 'columns, got' not in str(e):
+                raise
+            if start is not None:
+                source.seek(start)
+            df = _read_with_pandas(source, columns, dtype)
+    else:
+        df = _read_with_pandas(source, columns, dtype)
+    
+    if dtype:
+        df = df.astype({name: requested for name, requested in dtype.items() if name in df.columns})
+    return _optimize_dtypes(df, keep=tuple(dtype or ()))
+
+
+def _project_columns(source: Union[Path, BinaryIO], usecols: Optional[Sequence[str]]) -> Optional[Tuple[str, ...]]:
+    """
+    The header names of a CSV that appear in usecols, in file order.
+    
+    Returns None (read every column) when usecols is None, names none of the file's
+    columns, or the header repeats a name (readers rename those, so the raw names
+    are ambiguous). Buffers are rewound to where they started after the header is read.
+    """
+    if usecols is None:
+        return None
+    
+    wanted = set(usecols)
+    if isinstance(source, Path):
+        with open(source, newline='', encoding='utf-8-sig', errors='replace') as f:
+            header = next(csv.reader(f), [])
+    else:
+        start = source.tell()
+        text = io.TextIOWrapper(source, newline='', encoding='utf-8-sig', errors='replace')
+        header = next(csv.reader(text), [])
+        text.detach()
+        source.seek(start)
+    
+    if len(set(header)) < len(header):
+        return None
+    columns = tuple(name for name in header if name in wanted)
+    return columns or None
+
+
+def _read_with_sidecar(
+    path: Path,
+    mtime_ns: int,
+    size: int,
+    engine: str,
+    columns: Optional[Tuple[str, ...]] = None
+) -> pd.DataFrame:
+    """
+    Load a CSV file through a Parquet copy saved next to it (<name>.csv.parquet).
+    
+    The sidecar records the CSV's size, modification time and the engine that parsed
+    it in its schema metadata, and is used only while all three still match; a CSV
+    replaced by a copy with the same timestamp, or read with another engine, is parsed
+    again. Reading and writing it are best-effort: a stale, corrupt or unwritable
+    sidecar just means the CSV is parsed as usual. Only full loads write the sidecar;
+    projected loads read just their columns from it.
+    """
+    sidecar = path.with_suffix(path.suffix + '.parquet')
+    source_key = json.dumps({'mtime_ns': mtime_ns, 'size': size, 'engine': engine}).encode()
+    try:
+        metadata = pq.read_schema(sidecar).metadata or {}
+        if metadata.get(b'csv_checker_source') == source_key:
+            return pd.read_parquet(sidecar, engine='pyarrow', columns=list(columns) if columns is not None else None)
+    except Exception:
+        pass
+    
+    df = _parse_csv(path, engine, columns)
+    if columns is not None:
+        return df
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), b'csv_checker_source': source_key})
+        pq.write_table(table, sidecar, compression='zstd')
+    except Exception:
+        pass
+    return df
+
+
+@lru_cache(maxsize=2)
+def _parse_file_cached(
+    path: str,
+    mtime_ns: int,
+    size: int,
+    engine: str,
+    columns: Optional[Tuple[str, ...]] = None,
+    dtype_items: Optional[Tuple[Tuple[str, Any], ...]] = None
+) -> pd.DataFrame:
+    """
+    Parse a CSV file once per (path, modification time, size, engine, columns, dtypes).
+    
+    dtype_items is the dtype mapping as hashable (name, dtype) pairs. Typed loads
+    bypass the Parquet sidecar, which stores the inferred dtypes. Kept small since
+    every entry pins a whole DataFrame in memory.
+    """
+    if dtype_items:
+        return _parse_csv(Path(path), engine, columns, dict(dtype_items))
+    if pa is not None and os.environ.get('CSV_CHECKER_PARQUET_SIDECAR') == '1':
+        return _read_with_sidecar(Path(path), mtime_ns, size, engine, columns)
+    return _parse_csv(Path(path), engine, columns)
+
+
+def load_csv(
+    filepath: Union[str, Path, BinaryIO],
+    usecols: Optional[Sequence[str]] = None,
+    dtype: Optional[Dict[str, Any]] = None
+) -> pd.DataFrame:
     """
     Safely load CSV file with pandas, catching parsing errors.
     
+    Uses the PyArrow CSV reader when available, falling back to pd.read_csv. Setting
+    the CSV_CHECKER_ENGINE environment variable to 'polars' opts into the Polars
+    reader when it is installed. Re-loading an unchanged file copies the frame parsed
+    last time instead of parsing again; every call returns an independent frame. Setting
+    CSV_CHECKER_PARQUET_SIDECAR=1 also saves a Parquet copy next to each file and
+    reads that on later runs while the CSV is unchanged. Columns are stored in the
+    narrowest dtype that keeps every value (e.g. int8, float32, category).
+    
     Args:
-        filepath: Path to the CSV file
+        filepath: Path to the CSV file, or a binary file-like object holding CSV data
+        usecols: Optional column names to load; the rest of the file is not converted.
+                 Names missing from the file are ignored, and if none are present
+                 every column is loaded.
+        dtype: Optional mapping of column name to pandas dtype (e.g. 'int64', 'string')
+               for columns whose type is known up front; they are converted straight
+               to it instead of being inferred, and are not compacted
         
     Returns:
         pd.DataFrame: Loaded CSV data
@@ -24,21 +347,41 @@ def load_csv(filepath: Union[str, Path]) -> pd.DataFrame:
         CSVLoadError: If file cannot be loaded or parsed
     """
     try:
-        filepath = Path(filepath)
-        
-        if not filepath.exists():
-            raise CSVLoadError(f"File not found: {filepath}")
-        
-        if not filepath.suffix.lower() == '.csv':
-            raise CSVLoadError(f"File is not a CSV: {filepath}")
+        if hasattr(filepath, 'read'):
+            # In-memory upload: nothing to stat, errors are reported against its name
+            source = filepath
+            filepath = getattr(filepath, 'name', 'in-memory CSV')
+        else:
+            filepath = source = Path(filepath)
+            
+            if not filepath.exists():
+                raise CSVLoadError(f"File not found: {filepath}")
             
-        df = pd.read_csv(filepath)
+            if not filepath.suffix.lower() == '.csv':
+                raise CSVLoadError(f"File is not a CSV: {filepath}")
+            
+            # Zero-byte or blank placeholder files are rejected without starting a parser
+            stat = filepath.stat()
+            if stat.st_size == 0 or (stat.st_size < 4 and not filepath.read_bytes().strip()):
+                raise CSVLoadError(f"CSV file is empty or has no data: {filepath}")
+            
+        engine = 'polars' if pl is not None and os.environ.get('CSV_CHECKER_ENGINE') == 'polars' else 'default'
+        columns = _project_columns(source, usecols)
+        if isinstance(source, Path):
+            # Repeat runs on an unchanged file skip parsing; the copy keeps any edit
+            # by one caller, in place or not, from reaching the cached frame
+            dtype_items = tuple(dtype.items()) if dtype else None
+            df = _parse_file_cached(str(source.resolve()), stat.st_mtime_ns, stat.st_size, engine, columns, dtype_items).copy()
+        else:
+            df = _parse_csv(source, engine, columns, dtype)
         
         if df.empty:
             raise CSVLoadError(f"CSV file is empty: {filepath}")
             
         return df
         
+    except CSVLoadError:
+        raise
     except pd.errors.EmptyDataError:
         raise CSVLoadError(f"CSV file is empty or has no data: {filepath}")
     except pd.errors.ParserError as e:
@@ -46,4 +389,68 @@ def load_csv(filepath: Union[str, Path]) -> pd.DataFrame:
     except UnicodeDecodeError as e:
         raise CSVLoadError(f"Encoding error in CSV file: {filepath}. Error: {str(e)}")
     except Exception as e:
-        raise CSVLoadError(f"Unexpected error loading CSV file: {filepath}. Error: {str(e)}")
\ No newline at end of file
+        if pl is not None and isinstance(e, pl.exceptions.NoDataError):
+            raise CSVLoadError(f"CSV file is empty or has no data: {filepath}")
+        if pl is not None and isinstance(e, pl.exceptions.ComputeError):
+            raise CSVLoadError(f"Failed to parse CSV file: {filepath}. Error: {str(e)}")
+        if pa is not None and isinstance(e, pa.ArrowInvalid):
+            if 'Empty CSV file' in str(e):
+                raise CSVLoadError(f"CSV file is empty or has no data: {filepath}")
+            raise CSVLoadError(f"Failed to parse CSV file: {filepath}. Error: {str(e)}")
+        raise CSVLoadError(f"Unexpected error loading CSV file: {filepath}. Error: {str(e)}")
+
+
+def load_csv_chunks(
+    filepath: Union[str, Path, BinaryIO],
+    chunksize: int = 200_000,
+    usecols: Optional[Sequence[str]] = None,
+    dtype: Optional[Dict[str, Any]] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Read a CSV file in row chunks so only one chunk is held in memory at a time.
+    
+    Column dtypes are inferred per chunk by pd.read_csv. File-like objects are
+    rewound first, so the same buffer can be streamed more than once.
+    
+    Args:
+        filepath: Path to the CSV file, or a binary file-like object holding CSV data
+        chunksize: Maximum number of rows per chunk
+        usecols: Optional column names to load, as for load_csv
+        dtype: Optional mapping of column name to pandas dtype, as for load_csv
+        
+    Yields:
+        pd.DataFrame: Consecutive chunks of the file
+        
+    Raises:
+        CSVLoadError: If file cannot be found, parsed, or has no data rows
+    """
+    if hasattr(filepath, 'read'):
+        source = filepath
+        filepath = getattr(filepath, 'name', 'in-memory CSV')
+        if hasattr(source, 'seek'):
+            source.seek(0)
+    else:
+        filepath = source = Path(filepath)
+        
+        if not filepath.exists():
+            raise CSVLoadError(f"File not found: {filepath}")
+        
+        if not filepath.suffix.lower() == '.csv':
+            raise CSVLoadError(f"File is not a CSV: {filepath}")
+    
+    row_count = 0
+    try:
+        columns = _project_columns(source, usecols)
+        with pd.read_csv(source, chunksize=chunksize, usecols=list(columns) if columns is not None else None, dtype=dtype) as reader:
+            for chunk in reader:
+                row_count += len(chunk)
+                yield chunk
+    except pd.errors.EmptyDataError:
+        raise CSVLoadError(f"CSV file is empty or has no data: {filepath}")
+    except pd.errors.ParserError as e:
+        raise CSVLoadError(f"Failed to parse CSV file: {filepath}. Error: {str(e)}")
+    except UnicodeDecodeError as e:
+        raise CSVLoadError(f"Encoding error in CSV file: {filepath}. Error: {str(e)}")
+    
+    if row_count == 0:
+        raise CSVLoadError(f"CSV file is empty: {filepath}")
@@ -1,33 +1,59 @@
 """Main quality checking pipeline that orchestrates all data quality checks."""
 
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, List, Optional, Union, BinaryIO
 from pathlib import Path
 import pandas as pd
 
-from .data_loader import load_csv, CSVLoadError
-from .checks import check_row_count, check_data_types, check_value_ranges, check_data_consistency, check_automatic_quality
+from .data_loader import load_csv, load_csv_chunks, CSVLoadError
+from .checks import (
+    check_row_count, check_data_types, check_value_ranges, check_data_consistency, check_automatic_quality,
+    check_data_types_chunked, check_value_ranges_chunked, check_data_consistency_chunked
+)
+
+# Status markers for format_results_summary, keyed by use_emoji; the ASCII set
+# suits logs and consoles that cannot render emoji
+_SUMMARY_MARKERS = {
+    True: {'ok': '✅', 'fail': '❌', 'data': '📊', 'checks': '🔍', 'warn': '⚠️', 'bullet': '•', 'times': '×'},
+    False: {'ok': '[OK]', 'fail': '[FAIL]', 'data': '[DATA]', 'checks': '[CHECKS]', 'warn': '[WARN]', 'bullet': '-', 'times': 'x'}
+}
 
 
 def run_quality_checks(
-    file: Union[str, Path], 
+    file: Union[str, Path, BinaryIO], 
     schema: Optional[Dict[str, str]] = None,
     rules: Optional[Dict[str, Dict[str, Any]]] = None,
-    min_rows: int = 1
+    min_rows: int = 1,
+    chunksize: Optional[int] = None,
+    detailed: bool = False,
+    columns: Optional[List[str]] = None,
+    project_only: bool = False,
+    df: Optional[pd.DataFrame] = None
 ) -> Dict[str, Any]:
     """
     Run comprehensive data quality checks on a CSV file.
     
     Args:
-        file: Path to the CSV file
+        file: Path to the CSV file, or a binary file-like object holding CSV data
         schema: Dictionary mapping column names to expected types
         rules: Dictionary mapping column names to validation rules
         min_rows: Minimum required number of rows
+        chunksize: If given, stream the file in chunks of this many rows instead of
+                   loading it whole (see _run_chunked_checks)
+        detailed: If True, also report memory_usage_deep_mb, which counts the bytes
+                  of every string value and so costs a pass over all text columns
+        columns: If given, only these columns are loaded and checked (see load_csv)
+        project_only: If True and columns is not given, only load the columns named
+                      in schema and rules
+        df: Already-loaded data to check instead of reading file, which then only
+            names the results; chunksize is ignored and columns selects from df
         
     Returns:
         Dict containing comprehensive quality check results
     """
+    file_path = getattr(file, 'name', 'in-memory CSV') if hasattr(file, 'read') else str(file)
     results = {
-        'file_path': str(file),
+        'file_path': file_path,
+        'file_name': Path(file_path).name,
         'load_success': False,
         'checks': [],
         'summary': {
@@ -39,59 +65,129 @@ def run_quality_checks(
         'errors': []
     }
     
+    if columns is None and project_only:
+        columns = list(dict.fromkeys([*(schema or {}), *(rules or {})])) or None
+    
+    if chunksize and df is None:
+        return _run_chunked_checks(results, file, schema, rules, min_rows, chunksize, detailed, columns)
+    
     try:
-        # Load the CSV file
-        df = load_csv(file)
+        # Load the CSV file unless the caller already has it in memory
+        if df is None:
+            df = load_csv(file, usecols=columns)
+        elif columns is not None:
+            # Same selection rules as load_csv(usecols=...)
+            wanted = set(columns)
+            present = [name for name in df.columns if name in wanted]
+            if present:
+                df = df[present]
         results['load_success'] = True
         results['data_info'] = {
             'row_count': len(df),
             'column_count': len(df.columns),
             'columns': list(df.columns),
-            'memory_usage_mb': round(df.memory_usage(deep=True).sum() / 1024 / 1024, 2)
+            'memory_usage_mb': round(df.memory_usage().sum() / 1024 / 1024, 2)
         }
+        if detailed:
+            results['data_info']['memory_usage_deep_mb'] = round(df.memory_usage(deep=True).sum() / 1024 / 1024, 2)
         
     except CSVLoadError as e:
         results['errors'].append(f"Failed to load CSV: {str(e)}")
         return results
     
-    # Run row count check
-    try:
-        row_check = check_row_count(df, min_rows=min_rows)
-        results['checks'].append(row_check)
-    except Exception as e:
-        results['errors'].append(f"Row count check failed: {str(e)}")
+    # The checks run one after another: most of their time is GIL-bound value
+    # classification, and wide frames already fan out per column in _map_columns
+    check_calls = [('Row count', lambda: check_row_count(df, min_rows=min_rows))]
     
     # Run data type check if schema provided
     if schema:
-        try:
-            type_check = check_data_types(df, schema)
-            results['checks'].append(type_check)
-        except Exception as e:
-            results['errors'].append(f"Data type check failed: {str(e)}")
+        check_calls.append(('Data type', lambda: check_data_types(df, schema)))
     
     # Run value range check if rules provided
     if rules:
-        try:
-            range_check = check_value_ranges(df, rules)
-            results['checks'].append(range_check)
-        except Exception as e:
-            results['errors'].append(f"Value range check failed: {str(e)}")
+        check_calls.append(('Value range', lambda: check_value_ranges(df, rules)))
     
     # Run data consistency check (always run this)
-    try:
-        consistency_check = check_data_consistency(df)
-        results['checks'].append(consistency_check)
-    except Exception as e:
-        results['errors'].append(f"Data consistency check failed: {str(e)}")
+    check_calls.append(('Data consistency', lambda: check_data_consistency(df)))
     
     # Run automatic quality check (always run this - main outlier detection)
+    check_calls.append(('Automatic quality', lambda: check_automatic_quality(df)))
+    
+    for label, run_check in check_calls:
+        try:
+            results['checks'].append(run_check())
+        except Exception as e:
+            results['errors'].append(f"{label} check failed: {str(e)}")
+    
+    _summarize_checks(results)
+    return results
+
+
+def _run_chunked_checks(
+    results: Dict[str, Any],
+    file: Union[str, Path, BinaryIO],
+    schema: Optional[Dict[str, str]],
+    rules: Optional[Dict[str, Dict[str, Any]]],
+    min_rows: int,
+    chunksize: int,
+    detailed: bool = False,
+    columns: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Streaming counterpart of run_quality_checks for files too large to load at once.
+    
+    The file is re-read once per check so only one chunk is in memory at a time,
+    trading parse time for peak memory. The automatic quality check needs every value
+    of a column at once and is skipped.
+    """
+    row_count = 0
+    memory_bytes = 0
+    deep_memory_bytes = 0
+    seen_columns = []
     try:
-        automatic_check = check_automatic_quality(df)
-        results['checks'].append(automatic_check)
-    except Exception as e:
-        results['errors'].append(f"Automatic quality check failed: {str(e)}")
+        for chunk in load_csv_chunks(file, chunksize, usecols=columns):
+            if not seen_columns:
+                seen_columns = list(chunk.columns)
+            row_count += len(chunk)
+            memory_bytes += chunk.memory_usage().sum()
+            if detailed:
+                deep_memory_bytes += chunk.memory_usage(deep=True).sum()
+    except CSVLoadError as e:
+        results['errors'].append(f"Failed to load CSV: {str(e)}")
+        return results
+    
+    results['load_success'] = True
+    results['data_info'] = {
+        'row_count': row_count,
+        'column_count': len(seen_columns),
+        'columns': seen_columns,
+        'memory_usage_mb': round(memory_bytes / 1024 / 1024, 2)
+    }
+    if detailed:
+        results['data_info']['memory_usage_deep_mb'] = round(deep_memory_bytes / 1024 / 1024, 2)
     
-    # Calculate summary statistics
+    # check_row_count only needs the length; a column-less RangeIndex frame costs nothing
+    results['checks'].append(check_row_count(pd.DataFrame(index=pd.RangeIndex(row_count)), min_rows=min_rows))
+    
+    chunked_checks = [
+        ('Data type', schema, lambda: check_data_types_chunked(load_csv_chunks(file, chunksize, usecols=columns), schema)),
+        ('Value range', rules, lambda: check_value_ranges_chunked(load_csv_chunks(file, chunksize, usecols=columns), rules)),
+        ('Data consistency', True, lambda: check_data_consistency_chunked(load_csv_chunks(file, chunksize, usecols=columns)))
+    ]
+    for label, enabled, run_check in chunked_checks:
+        if not enabled:
+            continue
+        try:
+            results['checks'].append(run_check())
+        except Exception as e:
+            results['errors'].append(f"{label} check failed: {str(e)}")
+    
+    _summarize_checks(results)
+    return results
+
+
+def _summarize_checks(results: Dict[str, Any]) -> None:
+    """Fill in the summary statistics from the completed checks."""
     total_checks = len(results['checks'])
     passed_checks = sum(1 for check in results['checks'] if check.get('passed', False))
     failed_checks = total_checks - passed_checks
@@ -103,32 +199,33 @@ def run_quality_checks(
         'overall_passed': failed_checks == 0 and total_checks > 0,
         'success_rate': round(passed_checks / total_checks * 100, 1) if total_checks > 0 else 0
     }
-    
-    return results
 
 
-def format_results_summary(results: Dict[str, Any]) -> str:
+def format_results_summary(results: Dict[str, Any], use_emoji: bool = True) -> str:
     """
     Format quality check results into a human-readable summary.
     
     Args:
         results: Results from run_quality_checks
+        use_emoji: Mark statuses with emoji; if False, plain ASCII tokens such as [OK]
         
     Returns:
         Formatted summary string
     """
-    if not results['load_success']:
-        return f"❌ Failed to load file: {results.get('errors', ['Unknown error'])[0]}"
+    markers = _SUMMARY_MARKERS[bool(use_emoji)]
+    
+    if not results.get('load_success'):
+        return f"{markers['fail']} Failed to load file: {results.get('errors', ['Unknown error'])[0]}"
     
     summary = results['summary']
     data_info = results.get('data_info', {})
     
-    status_emoji = "✅" if summary['overall_passed'] else "❌"
+    status_emoji = markers['ok'] if summary['overall_passed'] else markers['fail']
     
     lines = [
-        f"{status_emoji} Quality Check Summary for {Path(results['file_path']).name}",
-        f"📊 Data: {data_info.get('row_count', 0)} rows × {data_info.get('column_count', 0)} columns",
-        f"🔍 Checks: {summary['passed_checks']}/{summary['total_checks']} passed ({summary['success_rate']}%)",
+        f"{status_emoji} Quality Check Summary for {results.get('file_name') or Path(results['file_path']).name}",
+        f"{markers['data']} Data: {data_info.get('row_count', 0)} rows {markers['times']} {data_info.get('column_count', 0)} columns",
+        f"{markers['checks']} Checks: {summary['passed_checks']}/{summary['total_checks']} passed ({summary['success_rate']}%)",
         ""
     ]
     
@@ -136,14 +233,14 @@ def format_results_summary(results: Dict[str, Any]) -> str:
     for check in results['checks']:
         check_type = check.get('check_type', 'unknown')
         passed = check.get('passed', False)
-        emoji = "✅" if passed else "❌"
+        emoji = markers['ok'] if passed else markers['fail']
         message = check.get('message', 'No message')
         lines.append(f"{emoji} {check_type.replace('_', ' ').title()}: {message}")
     
     if results.get('errors'):
-        lines.append("\n⚠️  Errors:")
+        lines.append(f"\n{markers['warn']}  Errors:")
         for error in results['errors']:
-            lines.append(f"  • {error}")
+            lines.append(f"  {markers['bullet']} {error}")
     
     return "\n".join(lines)
 
@@ -166,22 +263,35 @@ def get_detailed_issues(results: Dict[str, Any]) -> Dict[str, Any]:
     }
     
     for check in results.get('checks', []):
-        check_type = check.get('check_type')
-        
-        if check_type == 'data_types' and not check.get('passed', True):
-            issues['data_type_issues'] = {
-                'mismatches': check.get('mismatches', {}),
-                'missing_columns': check.get('missing_columns', [])
-            }
-        
-        elif check_type == 'value_ranges' and not check.get('passed', True):
-            issues['value_range_issues'] = check.get('violations', {})
-            issues['total_issue_count'] += check.get('total_violations', 0)
-        
-        elif check_type == 'row_count' and not check.get('passed', True):
-            issues['row_count_issues'] = {
-                'actual_rows': check.get('row_count', 0),
-                'required_rows': check.get('min_rows_required', 1)
-            }
+        handler = _ISSUE_HANDLERS.get(check.get('check_type'))
+        if handler is not None and not check.get('passed', True):
+            handler(check, issues)
     
-    return issues
\ No newline at end of file
+    return issues
+
+
+def _add_data_type_issues(check: Dict[str, Any], issues: Dict[str, Any]) -> None:
+    issues['data_type_issues'] = {
+        'mismatches': check.get('mismatches', {}),
+        'missing_columns': check.get('missing_columns', [])
+    }
+
+
+def _add_value_range_issues(check: Dict[str, Any], issues: Dict[str, Any]) -> None:
+    issues['value_range_issues'] = check.get('violations', {})
+    issues['total_issue_count'] += check.get('total_violations', 0)
+
+
+def _add_row_count_issues(check: Dict[str, Any], issues: Dict[str, Any]) -> None:
+    issues['row_count_issues'] = {
+        'actual_rows': check.get('row_count', 0),
+        'required_rows': check.get('min_rows_required', 1)
+    }
+
+
+# Failed checks of these types contribute to get_detailed_issues; others are skipped
+_ISSUE_HANDLERS = {
+    'data_types': _add_data_type_issues,
+    'value_ranges': _add_value_range_issues,
+    'row_count': _add_row_count_issues
+}
\ No newline at end of file
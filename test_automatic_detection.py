@@ -1,9 +1,14 @@
 #!/usr/bin/env python3
 """Test automatic data type inference and outlier detection."""
 
+import re
 import sys
+import pandas as pd
 sys.path.append('.')
 
+_INT_RE = re.compile(r'^[+-]?\d+$')
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')  # YYYY-MM-DD
+
 def test_validation_logic():
     """Test the core validation functions."""
     
@@ -19,12 +24,11 @@ def test_validation_logic():
             return False
     
     def test_is_valid_date(value_str: str) -> bool:
-        import re
         date_patterns = [
-            r'^\d{4}-\d{2}-\d{2}$',  # YYYY-MM-DD
+            _DATE_RE,
         ]
         for pattern in date_patterns:
-            if re.match(pattern, value_str):
+            if pattern.match(value_str):
                 return True
         return False
     
@@ -67,27 +71,18 @@ def test_inference_logic():
         "blood_pressure": ["120/80", "135/85", "abc", "142/90", "150/95"]  # Should infer: str (all text, even though abc is outlier)
     }
     
-    # Simple inference logic
+    # Simple inference logic, classifying the whole column at once
     def infer_column_type(values):
-        integer_count = 0
-        date_count = 0
-        text_count = 0
+        raw = pd.Series(values, dtype=object).astype(str)
+        value_strs = raw.str.strip()
         outliers = []
         
-        for i, value in enumerate(values):
-            value_str = str(value).strip()
-            
-            # Test if it's a valid integer
-            try:
-                int(value_str)
-                integer_count += 1
-            except ValueError:
-                # Test if it's a valid date
-                import re
-                if re.match(r'^\d{4}-\d{2}-\d{2}$', value_str):
-                    date_count += 1
-                else:
-                    text_count += 1
+        # Integers first, then dates; everything else counts as text
+        is_int = value_strs.str.match(_INT_RE)
+        is_date = ~is_int & value_strs.str.match(_DATE_RE)
+        integer_count = int(is_int.sum())
+        date_count = int(is_date.sum())
+        text_count = len(values) - integer_count - date_count
         
         total = len(values)
         
@@ -95,18 +90,13 @@ def test_inference_logic():
         if integer_count / total >= 0.7:
             inferred = "int"
             # Find non-integer outliers
-            for i, value in enumerate(values):
-                try:
-                    int(str(value))
-                except ValueError:
-                    outliers.append(f"Row {i}: '{value}' (expected int)")
+            for i in raw.index[~is_int]:
+                outliers.append(f"Row {i}: '{values[i]}' (expected int)")
         elif date_count / total >= 0.7:
             inferred = "datetime"
             # Find non-date outliers
-            for i, value in enumerate(values):
-                import re
-                if not re.match(r'^\d{4}-\d{2}-\d{2}$', str(value)):
-                    outliers.append(f"Row {i}: '{value}' (expected date)")
+            for i in raw.index[~raw.str.match(_DATE_RE)]:
+                outliers.append(f"Row {i}: '{values[i]}' (expected date)")
         else:
             inferred = "str"
             # For mixed data, might still flag inconsistencies
@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 """Test the improved detection logic with the actual problematic cases."""
 
-import sys
 import re
+import sys
+import pandas as pd
 sys.path.append('.')
 
+_BP_RE = re.compile(r'^\d+/\d+$')
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
 def test_gender_detection():
     """Test gender column detection - should not flag M/F as errors."""
     
@@ -24,24 +28,13 @@ def test_gender_detection():
         'text': 0
     }
     
-    classifications = []
+    value_strs = pd.Series(gender_values, dtype=object).astype(str).str.strip()
     
-    for i, value in enumerate(gender_values):
-        value_str = str(value).strip()
-        
-        # Enhanced logic: short alphabetic codes
-        if len(value_str) <= 3 and value_str.isalpha():
-            classification = 'short_categorical'
-            patterns['short_categorical'] += 1
-        else:
-            classification = 'text'
-            patterns['text'] += 1
-        
-        classifications.append({
-            'index': i,
-            'value': value,
-            'classification': classification
-        })
+    # Enhanced logic: short alphabetic codes
+    is_short = (value_strs.str.len() <= 3) & value_strs.str.isalpha()
+    classifications = pd.Series('text', index=value_strs.index).where(~is_short, 'short_categorical')
+    patterns['short_categorical'] = int(is_short.sum())
+    patterns['text'] = len(gender_values) - patterns['short_categorical']
     
     # Determine dominant type
     total = len(gender_values)
@@ -59,10 +52,10 @@ def test_gender_detection():
         
         # Find outliers
         expected_classification = dominant[0]
-        outliers = []
-        for item in classifications:
-            if item['classification'] != expected_classification:
-                outliers.append(f"Row {item['index']}: '{item['value']}'")
+        outliers = [
+            f"Row {i}: '{gender_values[i]}'"
+            for i in classifications.index[classifications != expected_classification]
+        ]
         
         if outliers:
             print(f"  ❌ Outliers found: {outliers}")
@@ -87,13 +80,13 @@ def test_blood_pressure_detection():
     # Your blood pressure data with one outlier
     bp_values = ['120/80', '135/85', 'abc', '142/90', '150/95', '125/82', '138/88', '130/85', '127/83', '140/89']
     
+    raw = pd.Series(bp_values, dtype=object).astype(str)
+    is_structured = raw.str.strip().str.match(_BP_RE)
+    
     # First pass: detect structured patterns
     structured_patterns = {}
-    for value in bp_values:
-        value_str = str(value).strip()
-        if re.match(r'^\d+/\d+$', value_str):
-            pattern_key = 'number/number'
-            structured_patterns[pattern_key] = structured_patterns.get(pattern_key, 0) + 1
+    if is_structured.any():
+        structured_patterns['number/number'] = int(is_structured.sum())
     
     print(f"Blood pressure column analysis:")
     print(f"  Values: {bp_values}")
@@ -115,30 +108,16 @@ def test_blood_pressure_detection():
         'float': 0
     }
     
-    classifications = []
     outliers = []
     
-    for i, value in enumerate(bp_values):
-        value_str = str(value).strip()
-        
-        if structured_pattern and re.match(r'^\d+/\d+$', value_str):
-            classification = 'structured_text'
-            patterns['structured_text'] += 1
-        else:
-            classification = 'text'
-            patterns['text'] += 1
-        
-        classifications.append({
-            'index': i,
-            'value': value,
-            'classification': classification
-        })
+    if structured_pattern:
+        patterns['structured_text'] = int(is_structured.sum())
+    patterns['text'] = len(bp_values) - patterns['structured_text']
     
     # Find outliers
     if structured_pattern:
-        for i, value in enumerate(bp_values):
-            if not re.match(r'^\d+/\d+$', str(value)):
-                outliers.append(f"Row {i}: '{value}' (expected {structured_pattern} pattern)")
+        for i in raw.index[~raw.str.match(_BP_RE)]:
+            outliers.append(f"Row {i}: '{bp_values[i]}' (expected {structured_pattern} pattern)")
     
     print(f"  Pattern classifications: {patterns}")
     print(f"  Inferred type: structured_text (number/number pattern)")
@@ -168,18 +147,15 @@ def test_visit_date_detection():
     date_values = ['2025-01-02', 'not_a_date', '2025-01-04', '2025-01-05', 'wrong_date', '2025-01-09', '2025-01-11', '2025-01-14', '2025-01-15']
     
     # Enhanced date detection
-    patterns = {'date': 0, 'text': 0}
-    outliers = []
-    
-    for i, value in enumerate(date_values):
-        value_str = str(value).strip()
-        
-        # Check if it matches date pattern
-        if re.match(r'^\d{4}-\d{2}-\d{2}$', value_str):
-            patterns['date'] += 1
-        else:
-            patterns['text'] += 1
-            outliers.append(f"Row {i}: '{value}' (expected YYYY-MM-DD date)")
+    value_strs = pd.Series(date_values, dtype=object).astype(str).str.strip()
+    
+    # Check which values match the date pattern
+    is_date = value_strs.str.match(_DATE_RE)
+    patterns = {'date': int(is_date.sum()), 'text': int((~is_date).sum())}
+    outliers = [
+        f"Row {i}: '{date_values[i]}' (expected YYYY-MM-DD date)"
+        for i in value_strs.index[~is_date]
+    ]
     
     total = len(date_values)
     date_percentage = (patterns['date'] / total) * 100
@@ -5,18 +5,6 @@ import sys
 import os
 sys.path.append('.')
 
-# Mock pandas for testing our logic without dependencies
-class MockSeries:
-    def __init__(self, data, name=None):
-        self.data = {i: val for i, val in enumerate(data)}
-        self.name = name
-    
-    def items(self):
-        return self.data.items()
-    
-    def dropna(self):
-        return [v for v in self.data.values() if str(v).lower() != 'nan']
-
 # Test our validation functions
 def test_validation_functions():
     """Test the individual validation functions with problematic data."""
@@ -55,7 +43,7 @@ def test_validation_functions():
     ]
     
     print("\n📅 Date validation tests:")
-    for value, expected in date_tests.items():
+    for value, expected in date_tests:
         result = _is_valid_date(value)
         status = "✅" if result == expected else "❌"
         print(f"  {status} '{value}' -> {result} (expected {expected})")
@@ -81,6 +69,7 @@ def test_content_validation():
     """Test the content validation logic."""
     
     try:
+        import pandas as pd
         from src.checks import _check_content_validity
     except ImportError:
         print("❌ Could not import content validation - check if pandas is installed")
@@ -90,14 +79,10 @@ def test_content_validation():
     
     # Test age column (should be integers)
     age_data = ["34", "45", "29", "51", "62", "NaN", "41", "33", "27", "invalid_age"]
-    age_series = MockSeries(age_data, "age")
-    
-    # Mock the pandas-specific functions we need
-    import pandas as pd
-    pd.isna = lambda x: str(x).lower() == 'nan'
+    age_series = pd.Series(age_data, name="age")
     
     try:
-        age_issues = _check_content_validity(age_series, 'int')
+        age_issues, _ = _check_content_validity(age_series, 'int')
         print(f"📊 Age validation found {len(age_issues)} issues:")
         for issue in age_issues:
             print(f"  • Row {issue['row_index']}: {issue['issue']}")
@@ -107,10 +92,10 @@ def test_content_validation():
     # Test date column
     date_data = ["2025-01-02", "not_a_date", "2025-01-04", "2025-01-05", "2025-01-08", 
                  "2025-01-09", "2025-01-11", "wrong_date", "2025-01-14", "2025-01-15"]
-    date_series = MockSeries(date_data, "visit_date")
+    date_series = pd.Series(date_data, name="visit_date")
     
     try:
-        date_issues = _check_content_validity(date_series, 'datetime')
+        date_issues, _ = _check_content_validity(date_series, 'datetime')
         print(f"\n📅 Date validation found {len(date_issues)} issues:")
         for issue in date_issues:
             print(f"  • Row {issue['row_index']}: {issue['issue']}")
@@ -0,0 +1,9 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def csv_dir(tmp_path_factory):
+    """One temporary directory for every test CSV written once per session."""
+    return tmp_path_factory.mktemp("csvs")
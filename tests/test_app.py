@@ -4,36 +4,30 @@ import pytest
 import pandas as pd
 import tempfile
 import os
+import streamlit
 from unittest.mock import Mock, patch, MagicMock
 
 # Import the app functions we want to test
 from app import display_results, display_detailed_results
 
 
+@pytest.fixture(scope='session')
+def shared_streamlit_mock():
+    """One Streamlit mock for the whole session; spec=streamlit turns typo'd attributes into errors."""
+    return MagicMock(spec=streamlit, name='st')
+
+
 @pytest.fixture
-def mock_streamlit():
-    """Mock Streamlit components for testing."""
-    with patch('app.st') as mock_st:
-        # Mock common Streamlit functions
-        mock_st.header = Mock()
-        mock_st.subheader = Mock()
-        mock_st.write = Mock()
-        mock_st.error = Mock()
-        mock_st.success = Mock()
-        mock_st.warning = Mock()
-        mock_st.metric = Mock()
-        mock_st.columns = Mock(return_value=[Mock(), Mock(), Mock(), Mock()])
-        mock_st.expander = Mock()
-        mock_st.dataframe = Mock()
-        mock_st.json = Mock()
-        mock_st.download_button = Mock()
-        
-        # Mock expander context manager
-        mock_expander = Mock()
-        mock_expander.__enter__ = Mock(return_value=mock_expander)
-        mock_expander.__exit__ = Mock(return_value=None)
-        mock_st.expander.return_value = mock_expander
-        
+def mock_streamlit(shared_streamlit_mock):
+    """Mock Streamlit components for testing, reset to a clean state for each test."""
+    mock_st = shared_streamlit_mock
+    mock_st.reset_mock(return_value=True, side_effect=True)
+    
+    # st.columns returns one container per requested column (MagicMock containers
+    # and expanders support the context manager protocol)
+    mock_st.columns.side_effect = lambda spec: [MagicMock() for _ in range(spec if isinstance(spec, int) else len(spec))]
+    
+    with patch('app.st', mock_st):
         yield mock_st
 
 
@@ -233,6 +227,73 @@ class TestDisplayDetailedResults:
         # Should display violation details
         mock_streamlit.dataframe.assert_called()
     
+    def test_display_all_passed_skips_expanders(self, mock_streamlit, sample_results):
+        """Test that an all-passed result renders the condensed summary only."""
+        for check in sample_results['checks']:
+            check['passed'] = True
+        mock_streamlit.columns.side_effect = lambda n: [MagicMock() for _ in range(n)]
+        
+        display_detailed_results(sample_results)
+        
+        mock_streamlit.success.assert_called()
+        mock_streamlit.table.assert_called_once()
+        assert mock_streamlit.expander.call_count == 0
+    
+    def test_display_outliers_single_table(self, mock_streamlit, sample_results):
+        """Test that outliers from every column are rendered as one table."""
+        sample_results['checks'] = [
+            {
+                'check_type': 'automatic_quality',
+                'passed': False,
+                'total_outliers': 3,
+                'column_analysis': {
+                    'age': {
+                        'inferred_type': 'integer',
+                        'confidence': 0.9,
+                        'outliers': [
+                            {'row_index': 5, 'value': 'NaN', 'issue': 'Expected integer, got "NaN"'},
+                            {'row_index': 9, 'value': 'invalid_age', 'issue': 'Expected integer, got "invalid_age"'}
+                        ]
+                    },
+                    'visit_date': {
+                        'inferred_type': 'date',
+                        'confidence': 0.8,
+                        'outliers': [
+                            {'row_index': 1, 'value': 'not_a_date', 'issue': 'Expected date, got "not_a_date"'}
+                        ]
+                    }
+                },
+                'message': 'Automatic quality check found 3 outliers'
+            }
+        ]
+        mock_streamlit.columns.side_effect = lambda n: [MagicMock() for _ in range(n)]
+        
+        display_detailed_results(sample_results)
+        
+        mock_streamlit.dataframe.assert_called_once()
+        table = mock_streamlit.dataframe.call_args[0][0]
+        assert table.num_rows == 3
+        assert table.column('column').to_pylist() == ['age', 'age', 'visit_date']
+    
+    def test_download_names_use_uploaded_filename(self, mock_streamlit, sample_results):
+        """Test that download file names come from the uploaded file, not file_path."""
+        sample_results['file_path'] = 'in-memory CSV'
+        mock_streamlit.columns.side_effect = lambda n: [MagicMock() for _ in range(n)]
+        
+        display_detailed_results(sample_results, "patients.csv")
+        
+        file_names = [call.kwargs['file_name'] for call in mock_streamlit.download_button.call_args_list]
+        assert file_names == ['quality_results_patients.json', 'quality_summary_patients.txt']
+    
+    def test_download_uses_precomputed_payloads(self, mock_streamlit, sample_results):
+        """Test that payloads serialized once per run are reused rather than rebuilt."""
+        with patch('app._serialize_results') as mock_serialize:
+            display_detailed_results(sample_results, "patients.csv", ('{"cached": true}', 'cached summary'))
+        
+        mock_serialize.assert_not_called()
+        data = [call.kwargs['data'] for call in mock_streamlit.download_button.call_args_list]
+        assert data == ['{"cached": true}', 'cached summary']
+    
     def test_display_empty_results(self, mock_streamlit):
         """Test displaying results with no checks."""
         results = {'checks': []}
@@ -246,7 +307,7 @@ class TestDisplayDetailedResults:
 
 class TestAppIntegration:
     
-    @patch('app.run_quality_checks')
+    @patch('src.quality_pipeline.run_quality_checks')
     @patch('app.st')
     def test_quality_checks_integration(self, mock_st, mock_run_checks, sample_results):
         """Test that the app correctly calls quality checks."""
@@ -288,15 +349,15 @@ class TestAppIntegration:
             # This is expected - the app should handle this gracefully
             pass
     
-    @patch('app.tempfile.NamedTemporaryFile')
-    @patch('app.os.unlink')
-    def test_temporary_file_cleanup(self, mock_unlink, mock_tempfile):
-        """Test that temporary files are properly cleaned up."""
-        # Mock tempfile creation
-        mock_file = Mock()
-        mock_file.name = "/tmp/test_file.csv"
-        mock_tempfile.return_value.__enter__ = Mock(return_value=mock_file)
-        mock_tempfile.return_value.__exit__ = Mock()
-        
-        # The cleanup should happen in the finally block
-        # This is more of an integration test that would need actual file handling
\ No newline at end of file
+    @patch('src.quality_pipeline.run_quality_checks')
+    def test_cached_checks_reads_from_memory(self, mock_run_checks, sample_results):
+        """Test that uploaded bytes reach the pipeline as a buffer, not a temp file."""
+        from app import _cached_checks
+        
+        mock_run_checks.return_value = sample_results
+        csv_bytes = b"id,name\n1,Alice\n2,Bob\n"
+        
+        _cached_checks("test-cached-checks-reads-from-memory", csv_bytes, "{}", "{}", 1)
+        
+        source = mock_run_checks.call_args[0][0]
+        assert source.read() == csv_bytes
@@ -1,15 +1,20 @@
 """Unit tests for data quality checks."""
 
+import io
 import pytest
 import pandas as pd
 import numpy as np
 
-from src.checks import check_row_count, check_data_types, check_value_ranges
+from src import checks
+from src.checks import (
+    check_row_count, check_data_types, check_value_ranges, check_data_consistency, infer_column_types, check_automatic_quality,
+    check_value_ranges_chunked, check_data_consistency_chunked
+)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_df():
-    """Create a sample DataFrame for testing."""
+    """Create a sample DataFrame for testing, shared by the module since no check mutates it."""
     return pd.DataFrame({
         'id': [1, 2, 3, 4, 5],
         'name': ['Alice', 'Bob', 'Charlie', 'Diana', 'Eve'],
@@ -20,7 +25,7 @@ def sample_df():
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def empty_df():
     """Create an empty DataFrame."""
     return pd.DataFrame()
@@ -104,6 +109,19 @@ class TestDataTypeCheck:
         assert result['mismatches']['id']['expected'] == 'str'
         assert 'int' in result['mismatches']['id']['actual']
     
+    def test_data_types_mismatch_reports_uncompacted_dtype(self):
+        """Test that compact storage dtypes are reported as the dtype pandas would parse."""
+        df = pd.DataFrame({
+            'age': np.array([25, 30], dtype=np.int8),
+            'score': np.array([0.5, 1.5], dtype=np.float32),
+            'gender': pd.Categorical(['M', 'F'])
+        })
+        
+        result = check_data_types(df, {'age': 'float', 'score': 'int', 'gender': 'int'})
+        
+        actual = {column: mismatch['actual'] for column, mismatch in result['mismatches'].items()}
+        assert actual == {'age': 'int64', 'score': 'float64', 'gender': 'object'}
+    
     def test_data_types_missing_columns(self, sample_df):
         """Test data type check with missing columns."""
         schema = {
@@ -119,6 +137,36 @@ class TestDataTypeCheck:
         assert 'missing_col' in result['missing_columns']
         assert 'another_missing' in result['missing_columns']
     
+    def test_data_types_content_issues(self):
+        """Test that invalid values inside a text column are reported by row."""
+        df = pd.DataFrame({
+            'age': ['34', ' 45 ', 'NaN', '29', 'invalid_age', '+7', None],
+            'visit_date': ['2025-01-02', 'not_a_date', '2025-01-04', '2025-02-30', '01/15/2025', '2025-01-06', '2025-01-07']
+        })
+        
+        result = check_data_types(df, {'age': 'int', 'visit_date': 'datetime'})
+        
+        assert result['passed'] == False
+        age_issues = result['content_issues']['age']
+        assert [issue['row_index'] for issue in age_issues['invalid_values']] == [2, 4]
+        assert age_issues['total_invalid'] == 2
+        date_issues = result['content_issues']['visit_date']
+        assert [issue['value'] for issue in date_issues['invalid_values']] == ['not_a_date', '2025-02-30']
+    
+    def test_data_types_pyarrow_dtypes(self):
+        """Test that pyarrow-backed and nullable dtypes satisfy the matching schema types."""
+        df = pd.DataFrame({
+            'id': [1, 2, 3],
+            'score': [1.5, None, 2.5],
+            'name': ['a', 'b', 'c'],
+            'active': [True, False, None]
+        }).astype({'id': 'int64[pyarrow]', 'score': 'double[pyarrow]', 'name': 'string[pyarrow]', 'active': 'boolean'})
+        
+        result = check_data_types(df, {'id': 'int', 'score': 'float', 'name': 'str', 'active': 'bool'})
+        
+        assert result['passed'] == True
+        assert result['mismatches'] == {}
+    
     def test_data_types_empty_schema(self, sample_df):
         """Test data type check with empty schema."""
         result = check_data_types(sample_df, {})
@@ -161,9 +209,8 @@ class TestValueRangeCheck:
         
         # Check violation details
         violations = result['violations']['age']['violating_rows']
-        ages = [v['value'] for v in violations]
-        assert 25 in ages
-        assert 28 in ages
+        ages = {v['value'] for v in violations}
+        assert {25, 28} <= ages
     
     def test_value_ranges_max_violations(self, sample_df):
         """Test value range check with maximum value violations."""
@@ -192,6 +239,16 @@ class TestValueRangeCheck:
         violation = result['violations']['country']['violating_rows'][0]
         assert violation['value'] == 'MEX'
     
+    def test_value_ranges_allowed_values_categorical(self, sample_df):
+        """Test allowed-value checks on a categorical column, as compacted loads produce."""
+        country = pd.Categorical(['USA', 'CAN', 'USA', 'BRA', 'USA'], categories=['BRA', 'CAN', 'MEX', 'USA'])
+        df = sample_df.assign(country=country)
+        
+        result = check_value_ranges(df, {'country': {'allowed': ['USA', 'CAN', 'MEX']}})
+        
+        assert result['violations']['country']['violation_count'] == 1
+        assert result['violations']['country']['violating_rows'][0]['value'] == 'BRA'
+    
     def test_value_ranges_missing_column(self, sample_df):
         """Test value range check with missing column."""
         rules = {
@@ -218,10 +275,139 @@ class TestValueRangeCheck:
         violation = result['violations']['age']['violating_rows'][0]
         assert violation['value'] == 35  # Charlie's age
     
+    def test_value_ranges_many_violations_capped(self):
+        """Test that every violation is counted but only the first 10 rows are reported."""
+        df = pd.DataFrame({'score': list(range(-25, 5))})
+        
+        result = check_value_ranges(df, {'score': {'min': 0}})
+        
+        score = result['violations']['score']
+        assert score['violation_count'] == 25
+        assert len(score['violating_rows']) == 10
+        assert score['violating_rows'][0] == {'row_index': 0, 'value': -25, 'rule_violated': 'min_value >= 0'}
+    
+    def test_value_ranges_custom_limit(self):
+        """Test that limit caps the reported rows without changing the count."""
+        df = pd.DataFrame({'score': list(range(-25, 5))})
+        
+        score = check_value_ranges(df, {'score': {'min': 0}}, limit=3)['violations']['score']
+        chunked = check_value_ranges_chunked(df, {'score': {'min': 0}}, chunksize=2, limit=3)['violations']['score']
+        
+        assert score['violation_count'] == chunked['violation_count'] == 25
+        assert [row['value'] for row in score['violating_rows']] == [-25, -24, -23]
+        assert chunked['violating_rows'] == score['violating_rows']
+    
     def test_value_ranges_empty_rules(self, sample_df):
         """Test value range check with empty rules."""
         result = check_value_ranges(sample_df, {})
         
         assert result['passed'] == True
         assert result['total_violations'] == 0
-        assert len(result['violations']) == 0
\ No newline at end of file
+        assert len(result['violations']) == 0
+
+
+class TestInferColumnTypes:
+    
+    def test_infer_numeric_dtypes(self, sample_df):
+        """Test that numeric dtype columns are inferred without outliers."""
+        analysis = infer_column_types(sample_df)
+        
+        assert analysis['age']['inferred_type'] == 'int'
+        assert analysis['age']['confidence'] == 1.0
+        assert analysis['salary']['inferred_type'] == 'float'
+        assert analysis['salary']['patterns']['float'] == 5
+        assert analysis['age']['outliers'] == []
+        assert analysis['salary']['outliers'] == []
+    
+    def test_infer_object_column_outliers(self):
+        """Test that text values in a mostly-integer object column are flagged."""
+        df = pd.DataFrame({'age': ['34', '45', '29', '51', 'invalid_age']})
+        
+        analysis = infer_column_types(df)
+        
+        assert analysis['age']['inferred_type'] == 'int'
+        assert len(analysis['age']['outliers']) == 1
+        assert analysis['age']['outliers'][0]['row_index'] == 4
+    
+    def test_automatic_quality_outliers_capped(self):
+        """Test that reported outliers are capped per column while the counts stay exact."""
+        df = pd.DataFrame({'age': [str(n) for n in range(20, 95)] + ['unknown'] * 25})
+        
+        result = check_automatic_quality(df, limit=5)
+        
+        age = result['column_analysis']['age']
+        assert result['total_outliers'] == age['outlier_count'] == 25
+        assert [outlier['row_index'] for outlier in age['outliers']] == list(range(75, 80))
+        assert check_automatic_quality(df)['column_analysis']['age']['outliers'][-1]['row_index'] == 99
+    
+    def test_infer_cached_result_is_a_copy(self):
+        """Test that a repeated inference on the same data is unaffected by caller edits."""
+        df = pd.DataFrame({'code': ['A1', 'B2', 'C3', 'x'] * 400})
+        
+        first = infer_column_types(df)
+        first['code']['outliers'].clear()
+        second = infer_column_types(df)
+        
+        assert second['code']['inferred_type'] == 'structured_text'
+        assert len(second['code']['outliers']) == 400
+
+
+class TestDataConsistencyCheck:
+    
+    def test_mixed_types_counts(self):
+        """Test that numeric and text values in one object column are counted."""
+        df = pd.DataFrame({'reading': ['1.5', ' 2 ', 'high', '3e2', 'high', None]})
+        
+        result = check_data_consistency(df)
+        
+        issues = {issue['type']: issue for issue in result['issues']['reading']}
+        assert issues['mixed_types']['numeric_values'] == 3
+        assert issues['mixed_types']['text_values'] == 2
+        assert issues['missing_values']['count'] == 1
+    
+    def test_long_values_classified_without_caching(self):
+        """Test that long cell strings are classified but kept out of the verdict cache."""
+        long_number = '1' * 200
+        long_text = 'free text note ' * 20
+        df = pd.DataFrame({'reading': [long_number, long_text, '2']})
+        before = checks._cached_value_flags.cache_info().currsize
+        
+        result = check_data_consistency(df)
+        
+        issues = {issue['type']: issue for issue in result['issues']['reading']}
+        assert issues['mixed_types']['numeric_values'] == 2
+        assert issues['mixed_types']['text_values'] == 1
+        assert checks._cached_value_flags.cache_info().currsize <= before + 1
+
+
+class TestChunkedChecks:
+    
+    def test_value_ranges_chunked_matches_full_counts(self):
+        """Test that chunked range checks count every violation across chunks."""
+        df = pd.DataFrame({'score': list(range(-25, 25))})
+        
+        result = check_value_ranges_chunked(df, {'score': {'min': 0, 'max': 20}}, chunksize=7)
+        
+        score = result['violations']['score']
+        assert score['violation_count'] == 29
+        assert [row['row_index'] for row in score['violating_rows']] == list(range(10))
+    
+    def test_consistency_chunked_matches_full_check(self):
+        """Test that chunked consistency checks agree with the in-memory check."""
+        df = pd.DataFrame({
+            'reading': ['1.5', 'high', None, '2', 'low', '3'] * 5,
+            'site': ['A'] * 30,
+            'notes': [None] * 30
+        })
+        
+        assert check_data_consistency_chunked(df, chunksize=4) == check_data_consistency(df)
+    
+    def test_consistency_chunked_text_in_late_chunk(self):
+        """Test that text in a late chunk of a numeric column is reported as mixed types."""
+        csv_text = "age\n" + "\n".join(['30', '41', '27', '35', '52', '29', 'unknown'])
+        
+        chunked = check_data_consistency_chunked(pd.read_csv(io.StringIO(csv_text), chunksize=3))
+        full = check_data_consistency(pd.read_csv(io.StringIO(csv_text)))
+        
+        assert chunked['issues']['age'] == full['issues']['age']
+        assert chunked['issues']['age'][0]['numeric_values'] == 6
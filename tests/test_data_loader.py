@@ -2,51 +2,48 @@
 
 import pytest
 import pandas as pd
-import tempfile
+import io
 import os
 from pathlib import Path
 
-from src.data_loader import load_csv, CSVLoadError
+from src import data_loader
+from src.data_loader import load_csv, load_csv_chunks, CSVLoadError, _parse_file_cached
 
 
-@pytest.fixture
-def valid_csv():
-    """Create a temporary valid CSV file."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-        f.write("id,name,age\n1,Alice,25\n2,Bob,30\n")
-        f.flush()
-        yield f.name
-    os.unlink(f.name)
+VALID_CSV = "id,name,age\n1,Alice,25\n2,Bob,30\n"
+MALFORMED_CSV = "id,name,age\n1,Alice,25\n2,Bob\n3,Charlie,35,extra"
 
 
 @pytest.fixture
-def malformed_csv():
+def valid_csv(tmp_path):
+    """Create a temporary valid CSV file (per test, since some tests modify it)."""
+    path = tmp_path / "valid.csv"
+    path.write_text(VALID_CSV)
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def malformed_csv(csv_dir):
     """Create a temporary malformed CSV file."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-        f.write("id,name,age\n1,Alice,25\n2,Bob\n3,Charlie,35,extra")
-        f.flush()
-        yield f.name
-    os.unlink(f.name)
+    path = csv_dir / "malformed.csv"
+    path.write_text(MALFORMED_CSV)
+    return str(path)
 
 
-@pytest.fixture
-def empty_csv():
+@pytest.fixture(scope="session")
+def empty_csv(csv_dir):
     """Create a temporary empty CSV file."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-        f.write("")
-        f.flush()
-        yield f.name
-    os.unlink(f.name)
+    path = csv_dir / "empty.csv"
+    path.touch()
+    return str(path)
 
 
-@pytest.fixture
-def non_csv_file():
+@pytest.fixture(scope="session")
+def non_csv_file(csv_dir):
     """Create a temporary non-CSV file."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-        f.write("This is not a CSV file")
-        f.flush()
-        yield f.name
-    os.unlink(f.name)
+    path = csv_dir / "not_a_csv.txt"
+    path.write_text("This is not a CSV file")
+    return str(path)
 
 
 def test_load_valid_csv(valid_csv):
@@ -68,6 +65,136 @@ def test_load_csv_with_path_object(valid_csv):
     assert len(df) == 2
 
 
+def test_load_csv_reloads_changed_file(valid_csv):
+    """Test that a repeat load is served from cache until the file changes."""
+    first = load_csv(valid_csv)
+    first['extra'] = 1
+    
+    assert 'extra' not in load_csv(valid_csv).columns
+    
+    with open(valid_csv, 'a') as f:
+        f.write("3,Carol,41\n")
+    
+    assert load_csv(valid_csv)['name'].tolist() == ['Alice', 'Bob', 'Carol']
+
+
+def test_load_csv_cached_frame_is_independent(valid_csv):
+    """Test that editing a loaded frame in place does not change later loads."""
+    first = load_csv(valid_csv)
+    first.loc[0, 'age'] = 99
+    first.loc[1, 'name'] = 'MUT'
+    
+    again = load_csv(valid_csv)
+    assert again['age'].tolist() == [25, 30]
+    assert again['name'].tolist() == ['Alice', 'Bob']
+
+
+def test_load_csv_parquet_sidecar(valid_csv, monkeypatch):
+    """Test that an opted-in load writes a Parquet sidecar and reads it back while the CSV is unchanged."""
+    monkeypatch.setenv('CSV_CHECKER_PARQUET_SIDECAR', '1')
+    sidecar = Path(valid_csv + '.parquet')
+    try:
+        df = load_csv(valid_csv)
+        assert sidecar.exists()
+        _parse_file_cached.cache_clear()
+        
+        # A matching sidecar is read instead of parsing the CSV
+        with monkeypatch.context() as patched:
+            patched.setattr(data_loader, '_parse_csv', lambda *args: pytest.fail("CSV was parsed again"))
+            assert load_csv(valid_csv).equals(df)
+        _parse_file_cached.cache_clear()
+        
+        # A CSV replaced by a copy with its old timestamp no longer matches the sidecar
+        stat = Path(valid_csv).stat()
+        Path(valid_csv).write_text(VALID_CSV + "3,Carol,41\n")
+        os.utime(valid_csv, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        
+        assert load_csv(valid_csv)['name'].tolist() == ['Alice', 'Bob', 'Carol']
+    finally:
+        sidecar.unlink(missing_ok=True)
+
+
+def test_load_csv_with_quoted_newlines(tmp_path):
+    """Test that quoted values spanning lines are kept in a single row."""
+    path = tmp_path / "notes.csv"
+    path.write_text('id,note\n1,"first line\nsecond line"\n2,plain\n')
+    
+    df = load_csv(path)
+    assert len(df) == 2
+    assert df.iloc[0]['note'] == "first line\nsecond line"
+
+
+def test_load_csv_from_buffer():
+    """Test loading CSV data from an in-memory binary buffer."""
+    df = load_csv(io.BytesIO(b"id,name,age\n1,Alice,25\n2,Bob,30\n"))
+    
+    assert isinstance(df, pd.DataFrame)
+    assert len(df) == 2
+    assert list(df.columns) == ['id', 'name', 'age']
+
+
+def test_load_csv_compacts_dtypes():
+    """Test that columns are narrowed only where no value changes."""
+    df = load_csv(io.BytesIO(b"id,half,price,gender\n1,0.5,0.1,M\n2,1.5,0.2,F\n3,2.5,0.3,M\n4,3.5,0.4,M\n5,4.5,0.5,F\n"))
+    
+    assert df['id'].dtype == 'int8'
+    assert df['half'].dtype == 'float32'
+    assert df['price'].dtype == 'float64'  # 0.1 has no exact float32 form
+    assert df['gender'].dtype == 'category'
+    assert df['price'].tolist() == [0.1, 0.2, 0.3, 0.4, 0.5]
+
+
+def test_load_csv_usecols():
+    """Test that only the requested columns are loaded and unknown names are ignored."""
+    df = load_csv(io.BytesIO(b"id,name,age\n1,Alice,25\n2,Bob,30\n"), usecols=['age', 'id', 'salary'])
+    
+    assert list(df.columns) == ['id', 'age']
+    assert df['age'].tolist() == [25, 30]
+
+
+def test_load_csv_with_dtype():
+    """Test that requested dtypes are used as given and not compacted."""
+    df = load_csv(io.BytesIO(b"id,name,age\n1,Alice,25\n2,Bob,30\n"), dtype={'id': 'int64', 'name': 'string', 'salary': 'float64'})
+    
+    assert df['id'].dtype == 'int64'
+    assert df['name'].dtype == 'string'
+    assert df['age'].dtype == 'int8'
+    assert list(df.columns) == ['id', 'name', 'age']
+
+
+def test_load_csv_short_rows_padded():
+    """Test that rows with missing trailing fields load with NaN, as pd.read_csv does."""
+    df = load_csv(io.BytesIO(b"a,b,c\n1,2\n3,4,5\n"))
+    
+    assert list(df.columns) == ['a', 'b', 'c']
+    assert df['c'].isna().tolist() == [True, False]
+
+
+def test_load_csv_duplicate_headers_renamed():
+    """Test that repeated header names get pandas-style suffixes."""
+    df = load_csv(io.BytesIO(b"a,a,b,a\n1,2,3,4\n"))
+    
+    assert list(df.columns) == ['a', 'a.1', 'b', 'a.2']
+    assert df['a.1'].tolist() == [2]
+
+
+def test_load_empty_buffer():
+    """Test that an empty buffer raises CSVLoadError."""
+    with pytest.raises(CSVLoadError, match="empty"):
+        load_csv(io.BytesIO(b""))
+
+
+def test_load_csv_chunks_from_buffer():
+    """Test streaming CSV data in row chunks, repeatably from the same buffer."""
+    buffer = io.BytesIO(b"id,name\n1,Alice\n2,Bob\n3,Carol\n")
+    
+    chunks = list(load_csv_chunks(buffer, chunksize=2))
+    
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert chunks[1]['name'].tolist() == ['Carol']
+    assert sum(len(chunk) for chunk in load_csv_chunks(buffer, chunksize=2)) == 3
+
+
 def test_load_nonexistent_file():
     """Test loading a file that doesn't exist."""
     with pytest.raises(CSVLoadError, match="File not found"):
@@ -86,6 +213,15 @@ def test_load_empty_csv(empty_csv):
         load_csv(empty_csv)
 
 
+def test_load_blank_csv(tmp_path):
+    """Test that a file holding only a line break is reported as empty."""
+    path = tmp_path / "blank.csv"
+    path.write_text("\n")
+    
+    with pytest.raises(CSVLoadError, match="^CSV file is empty"):
+        load_csv(path)
+
+
 def test_load_malformed_csv(malformed_csv):
     """Test loading a malformed CSV file."""
     # Note: pandas is quite forgiving, so this might not always raise an error
@@ -1,53 +1,77 @@
 """Unit tests for quality checking pipeline."""
 
+import io
 import pytest
-import tempfile
-import os
 from pathlib import Path
 
+from src import data_loader
+from src.data_loader import load_csv
 from src.quality_pipeline import run_quality_checks, format_results_summary, get_detailed_issues
 
 
-@pytest.fixture
-def sample_csv():
-    """Create a sample CSV file for testing."""
-    content = """id,name,age,salary,country
+SAMPLE_CSV = """id,name,age,salary,country
 1,Alice,25,50000.0,USA
 2,Bob,30,60000.0,CAN
 3,Charlie,35,70000.0,USA
 4,Diana,28,55000.0,MEX
 5,Eve,32,65000.0,USA"""
-    
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-        f.write(content)
-        f.flush()
-        yield f.name
-    os.unlink(f.name)
 
-
-@pytest.fixture
-def problematic_csv():
-    """Create a CSV file with data quality issues."""
-    content = """id,name,age,salary,country
+PROBLEMATIC_CSV = """id,name,age,salary,country
 1,Alice,150,50000.0,INVALID
 2,Bob,-5,60000.0,CAN
 3,Charlie,35,1000000.0,USA"""
-    
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-        f.write(content)
-        f.flush()
-        yield f.name
-    os.unlink(f.name)
+
+# Expectations that every row of SAMPLE_CSV meets
+SAMPLE_SCHEMA = {'id': 'int', 'name': 'str', 'age': 'int', 'salary': 'float', 'country': 'str'}
+SAMPLE_RULES = {
+    'age': {'min': 20, 'max': 40},
+    'salary': {'min': 40000, 'max': 80000},
+    'country': {'allowed': ['USA', 'CAN', 'MEX']}
+}
+
+# Column types of both test CSVs, so typed loads skip dtype inference
+SCHEMA_DTYPE = {'id': 'int64', 'age': 'int64', 'salary': 'float64', 'name': 'string', 'country': 'string'}
+
+
+def run_quality_checks_typed(path, dtype=SCHEMA_DTYPE, **kwargs):
+    """Run the pipeline on a CSV loaded with known column dtypes."""
+    return run_quality_checks(path, df=load_csv(path, dtype=dtype), **kwargs)
+
+
+@pytest.fixture(scope="session")
+def sample_csv(csv_dir):
+    """Create a sample CSV file for testing."""
+    path = csv_dir / "sample.csv"
+    path.write_text(SAMPLE_CSV)
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def problematic_csv(csv_dir):
+    """Create a CSV file with data quality issues."""
+    path = csv_dir / "problematic.csv"
+    path.write_text(PROBLEMATIC_CSV)
+    return str(path)
 
 
-@pytest.fixture
-def empty_csv():
+@pytest.fixture(scope="session")
+def sample_df_loaded(sample_csv):
+    """Load sample_csv once for tests that only look at the check results."""
+    return load_csv(sample_csv)
+
+
+@pytest.fixture(scope="session")
+def problematic_df_loaded(problematic_csv):
+    """Load problematic_csv once for tests that only look at the check results."""
+    return load_csv(problematic_csv)
+
+
+@pytest.fixture(scope="session")
+def empty_csv(csv_dir):
     """Create an empty CSV file."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-        f.write("")
-        f.flush()
-        yield f.name
-    os.unlink(f.name)
+    path = csv_dir / "empty.csv"
+    path.touch()
+    return str(path)
 
 
 class TestRunQualityChecks:
@@ -68,17 +92,9 @@ class TestRunQualityChecks:
         assert results['summary']['total_checks'] == 1
         assert results['summary']['passed_checks'] == 1
     
-    def test_with_schema_validation(self, sample_csv):
+    def test_with_schema_validation(self, sample_csv, sample_df_loaded):
         """Test pipeline with schema validation."""
-        schema = {
-            'id': 'int',
-            'name': 'str',
-            'age': 'int',
-            'salary': 'float',
-            'country': 'str'
-        }
-        
-        results = run_quality_checks(sample_csv, schema=schema)
+        results = run_quality_checks(sample_csv, schema=SAMPLE_SCHEMA, df=sample_df_loaded)
         
         assert results['load_success'] == True
         assert len(results['checks']) == 2  # row_count + data_types
@@ -91,15 +107,9 @@ class TestRunQualityChecks:
         assert results['summary']['passed_checks'] == 2
         assert results['summary']['overall_passed'] == True
     
-    def test_with_value_rules(self, sample_csv):
+    def test_with_value_rules(self, sample_csv, sample_df_loaded):
         """Test pipeline with value range rules."""
-        rules = {
-            'age': {'min': 20, 'max': 40},
-            'salary': {'min': 40000, 'max': 80000},
-            'country': {'allowed': ['USA', 'CAN', 'MEX']}
-        }
-        
-        results = run_quality_checks(sample_csv, rules=rules)
+        results = run_quality_checks(sample_csv, rules=SAMPLE_RULES, df=sample_df_loaded)
         
         assert results['load_success'] == True
         assert len(results['checks']) == 2  # row_count + value_ranges
@@ -112,21 +122,7 @@ class TestRunQualityChecks:
     
     def test_comprehensive_checks_all_pass(self, sample_csv):
         """Test pipeline with all checks enabled and passing."""
-        schema = {
-            'id': 'int',
-            'name': 'str',
-            'age': 'int',
-            'salary': 'float',
-            'country': 'str'
-        }
-        
-        rules = {
-            'age': {'min': 20, 'max': 40},
-            'salary': {'min': 40000, 'max': 80000},
-            'country': {'allowed': ['USA', 'CAN', 'MEX']}
-        }
-        
-        results = run_quality_checks(sample_csv, schema=schema, rules=rules, min_rows=3)
+        results = run_quality_checks(sample_csv, schema=SAMPLE_SCHEMA, rules=SAMPLE_RULES, min_rows=3)
         
         assert results['load_success'] == True
         assert len(results['checks']) == 3  # row_count + data_types + value_ranges
@@ -160,9 +156,9 @@ class TestRunQualityChecks:
         assert results['summary']['overall_passed'] == False
         assert results['summary']['failed_checks'] > 0
     
-    def test_row_count_failure(self, sample_csv):
+    def test_row_count_failure(self, sample_csv, sample_df_loaded):
         """Test pipeline with row count failure."""
-        results = run_quality_checks(sample_csv, min_rows=10)
+        results = run_quality_checks(sample_csv, min_rows=10, df=sample_df_loaded)
         
         assert results['load_success'] == True
         
@@ -176,10 +172,100 @@ class TestRunQualityChecks:
         results = run_quality_checks("nonexistent.csv")
         
         assert results['load_success'] == False
+        assert results['file_name'] == 'nonexistent.csv'
         assert len(results['errors']) > 0
         assert 'Failed to load CSV' in results['errors'][0]
         assert results['summary']['total_checks'] == 0
     
+    def test_chunked_matches_in_memory(self, problematic_csv):
+        """Test that streaming the file in chunks reports the same checks as loading it."""
+        schema = {'age': 'int', 'country': 'str'}
+        rules = {'age': {'min': 0, 'max': 120}, 'country': {'allowed': ['USA', 'CAN', 'MEX']}}
+        
+        in_memory = run_quality_checks(problematic_csv, schema=schema, rules=rules)
+        chunked = run_quality_checks(problematic_csv, schema=schema, rules=rules, chunksize=2)
+        
+        assert chunked['data_info']['row_count'] == 3
+        by_type = {check['check_type']: check for check in in_memory['checks']}
+        for check in chunked['checks']:
+            assert check['passed'] == by_type[check['check_type']]['passed']
+        range_check = next(c for c in chunked['checks'] if c['check_type'] == 'value_ranges')
+        assert range_check['total_violations'] == 3
+    
+    def test_detailed_memory_usage(self, sample_csv):
+        """Test that the string-inclusive memory figure is only computed on request."""
+        assert 'memory_usage_deep_mb' not in run_quality_checks(sample_csv)['data_info']
+        
+        data_info = run_quality_checks(sample_csv, detailed=True)['data_info']
+        assert data_info['memory_usage_deep_mb'] >= data_info['memory_usage_mb']
+    
+    def test_project_only_loads_checked_columns(self, sample_csv):
+        """Test that project_only limits loading to the schema and rule columns."""
+        results = run_quality_checks(sample_csv, schema={'age': 'int', 'bonus': 'float'}, rules={'country': {'allowed': ['USA', 'CAN', 'MEX']}}, project_only=True)
+        
+        assert results['data_info']['columns'] == ['age', 'country']
+        type_check = next(c for c in results['checks'] if c['check_type'] == 'data_types')
+        assert type_check['missing_columns'] == ['bonus']
+    
+    def test_preloaded_dataframe_skips_loading(self, sample_df_loaded):
+        """Test that a preloaded DataFrame is checked without reading the named file."""
+        results = run_quality_checks("never_written.csv", columns=['age', 'id'], df=sample_df_loaded)
+        
+        assert results['load_success'] == True
+        assert results['file_name'] == 'never_written.csv'
+        assert results['data_info']['columns'] == ['id', 'age']
+        assert len(results['errors']) == 0
+    
+    def test_project_only_chunked(self, sample_csv):
+        """Test that streaming in chunks loads and checks only the projected columns."""
+        schema = {'age': 'int', 'bonus': 'float'}
+        rules = {'country': {'allowed': ['USA', 'CAN', 'MEX']}}
+        
+        projected = run_quality_checks(sample_csv, columns=['age'], chunksize=2)
+        assert projected['data_info']['columns'] == ['age']
+        assert projected['data_info']['row_count'] == 5
+        
+        results = run_quality_checks(sample_csv, schema=schema, rules=rules, chunksize=2, project_only=True)
+        assert results['data_info']['columns'] == ['age', 'country']
+        type_check = next(c for c in results['checks'] if c['check_type'] == 'data_types')
+        assert type_check['missing_columns'] == ['bonus']
+    
+    def test_duplicate_headers_checked(self, tmp_path):
+        """Test that a file repeating a header name runs every check without errors."""
+        path = tmp_path / "duplicates.csv"
+        path.write_text("id,age,age\n1,25,26\n2,30,31\n")
+        
+        results = run_quality_checks(str(path), schema={'age.1': 'int'})
+        
+        assert results['errors'] == []
+        assert results['data_info']['columns'] == ['id', 'age', 'age.1']
+    
+    def test_arrow_reader_matches_pandas_reader(self, monkeypatch):
+        """Test that missing-value markers and dates reach the checks the same way through both readers."""
+        csv_bytes = (
+            b"id,visit_date,age,note\n1,2025-01-02,34,ok\n2,not_a_date,NA,\n"
+            b"3,2025-01-04,N/A,null\n4,2025-01-05,,ok\n5,2025-01-08,invalid_age,ok\n"
+        )
+        
+        arrow = run_quality_checks(io.BytesIO(csv_bytes))
+        monkeypatch.setattr(data_loader, 'pacsv', None)
+        pandas_only = run_quality_checks(io.BytesIO(csv_bytes))
+        
+        assert arrow['errors'] == pandas_only['errors'] == []
+        assert arrow['checks'] == pandas_only['checks']
+    
+    def test_typed_load_matches_inferred(self, problematic_csv):
+        """Test that loading with known dtypes gives the same check outcomes as inference."""
+        schema = {'age': 'int', 'salary': 'float', 'country': 'str'}
+        rules = {'age': {'min': 0, 'max': 100}, 'country': {'allowed': ['USA', 'CAN', 'MEX']}}
+        
+        inferred = run_quality_checks(problematic_csv, schema=schema, rules=rules)
+        typed = run_quality_checks_typed(problematic_csv, schema=schema, rules=rules)
+        
+        assert [c['passed'] for c in typed['checks']] == [c['passed'] for c in inferred['checks']]
+        range_check = next(c for c in typed['checks'] if c['check_type'] == 'value_ranges')
+        assert range_check['total_violations'] == 3
+    
     def test_empty_file_handling(self, empty_csv):
         """Test pipeline with empty CSV file."""
         results = run_quality_checks(empty_csv)
@@ -218,6 +304,12 @@ class TestFormatResultsSummary:
         
         assert "❌ Failed to load file" in summary
     
+    def test_format_partial_results(self):
+        """Test that a results dict without load_success is summarized instead of raising."""
+        summary = format_results_summary({'checks': []})
+        
+        assert "Failed to load file: Unknown error" in summary
+    
     def test_format_with_errors(self, sample_csv):
         """Test formatting when there are errors during processing."""
         results = run_quality_checks(sample_csv)
@@ -227,11 +319,22 @@ class TestFormatResultsSummary:
         
         assert "⚠️  Errors:" in summary
         assert "Test error message" in summary
+    
+    def test_format_ascii_markers(self, sample_csv):
+        """Test that use_emoji=False produces a pure ASCII summary."""
+        results = run_quality_checks(sample_csv)
+        results['errors'].append("Test error message")
+        
+        summary = format_results_summary(results, use_emoji=False)
+        
+        assert summary.isascii()
+        assert "[WARN]  Errors:" in summary
+        assert "  - Test error message" in summary
 
 
 class TestGetDetailedIssues:
     
-    def test_detailed_issues_extraction(self, problematic_csv):
+    def test_detailed_issues_extraction(self, problematic_csv, problematic_df_loaded):
         """Test extraction of detailed issue information."""
         schema = {'age': 'int', 'salary': 'float'}
         rules = {
@@ -240,7 +343,7 @@ class TestGetDetailedIssues:
             'country': {'allowed': ['USA', 'CAN', 'MEX']}
         }
         
-        results = run_quality_checks(problematic_csv, schema=schema, rules=rules)
+        results = run_quality_checks(problematic_csv, schema=schema, rules=rules, df=problematic_df_loaded)
         issues = get_detailed_issues(results)
         
         assert 'data_type_issues' in issues